@@ -10,149 +10,282 @@ This demonstrates a more complex MCP server with:
 
 from __future__ import annotations
 
-import asyncio
+import itertools
 import json
+from dataclasses import dataclass, field
 from typing import Any
 
 from mcp.server import Server
-from mcp.server.stdio import stdio_server
-from mcp.types import Resource, TextContent, Tool
+from mcp.types import ListResourcesRequest, ListToolsRequest, Resource, TextContent, Tool
 from pydantic import AnyUrl
 
+from examples.server_utils import (
+    ToolHandler,
+    dispatch,
+    memoize_static_handler,
+    require,
+    run,
+    serve_stdio,
+    text,
+)
 
 # Create server instance with state
 app = Server("example-advanced")
 
+
+@dataclass
+class UserStore:
+    """
+    In-memory user store kept as parallel columns.
+
+    Rows are located through an ID index; deletes swap the last row into the
+    freed slot, so they are O(1) but do not preserve insertion order.
+    """
+
+    ids: list[str] = field(default_factory=list)
+    names: list[str] = field(default_factory=list)
+    emails: list[str] = field(default_factory=list)
+    index: dict[str, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, user_id: object) -> bool:
+        return user_id in self.index
+
+    def add(self, user_id: str, name: str, email: str) -> dict[str, str]:
+        """Insert a user and return it as a dict."""
+        self.index[user_id] = len(self.ids)
+        self.ids.append(user_id)
+        self.names.append(name)
+        self.emails.append(email)
+        return {"id": user_id, "name": name, "email": email}
+
+    def get(self, user_id: str) -> dict[str, str] | None:
+        """Return a user as a dict, or None if the ID is unknown."""
+        idx = self.index.get(user_id)
+        if idx is None:
+            return None
+        return {"id": user_id, "name": self.names[idx], "email": self.emails[idx]}
+
+    def remove(self, user_id: str) -> None:
+        """Delete a user by ID."""
+        idx = self.index.pop(user_id)
+        last = len(self.ids) - 1
+        if idx != last:
+            self.ids[idx] = self.ids[last]
+            self.names[idx] = self.names[last]
+            self.emails[idx] = self.emails[last]
+            self.index[self.ids[idx]] = idx
+        self.ids.pop()
+        self.names.pop()
+        self.emails.pop()
+
+    def to_list(self) -> list[dict[str, str]]:
+        """Return every user as a dict."""
+        # The columns always have equal length; strict catches a broken invariant
+        return [
+            {"id": i, "name": n, "email": e}
+            for i, n, e in zip(self.ids, self.names, self.emails, strict=True)
+        ]
+
+
 # In-memory data store
-DATA_STORE: dict[str, Any] = {
-    "users": {
-        "1": {"id": "1", "name": "Alice", "email": "alice@example.com"},
-        "2": {"id": "2", "name": "Bob", "email": "bob@example.com"},
-    }
-}
+USERS = UserStore()
+USERS.add("1", "Alice", "alice@example.com")
+USERS.add("2", "Bob", "bob@example.com")
 
+# IDs are never reused, so a create after a delete cannot overwrite a user
+_id_counter = itertools.count(len(USERS) + 1)
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available tools."""
-    return [
-        Tool(
-            name="get_user",
-            description="Get user by ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "id": {"type": "string", "description": "User ID"},
-                },
-                "required": ["id"],
+# Serialized user lists are cached alongside the store version they were built
+# from; every write bumps the version so stale entries are rebuilt lazily
+_users_version = 0
+_list_users_cache: tuple[int, str] | None = None
+_users_resource_cache: tuple[int, str] | None = None
+
+# Serialized single users by ID; entries are dropped when the user changes
+_get_user_json_cache: dict[str, str] = {}
+
+
+# Tool and resource definitions are static, so build them once at import time;
+# Tool.model_construct skips validation, which is safe for fixed definitions
+_TOOLS_CACHE: list[Tool] = [
+    Tool.model_construct(
+        name="get_user",
+        description="Get user by ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "id": {"type": "string", "description": "User ID"},
             },
-        ),
-        Tool(
-            name="create_user",
-            description="Create a new user",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "User name"},
-                    "email": {"type": "string", "description": "User email"},
-                },
-                "required": ["name", "email"],
+            "required": ["id"],
+        },
+    ),
+    Tool.model_construct(
+        name="create_user",
+        description="Create a new user",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "User name"},
+                "email": {"type": "string", "description": "User email"},
             },
-        ),
-        Tool(
-            name="list_users",
-            description="List all users",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="delete_user",
-            description="Delete user by ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "id": {"type": "string", "description": "User ID"},
-                },
-                "required": ["id"],
+            "required": ["name", "email"],
+        },
+    ),
+    Tool.model_construct(
+        name="list_users",
+        description="List all users",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool.model_construct(
+        name="delete_user",
+        description="Delete user by ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "id": {"type": "string", "description": "User ID"},
             },
-        ),
-    ]
+            "required": ["id"],
+        },
+    ),
+]
 
+_RESOURCES_CACHE: list[Resource] = [
+    Resource(
+        uri=AnyUrl("users://all"),
+        name="All Users",
+        description="List of all users in the system",
+        mimeType="application/json",
+    ),
+]
+
+
+def _dumps(value: Any, *, indent: bool = False) -> str:
+    """
+    Serialize a value to JSON.
+
+    Always the stdlib: orjson can't write json.dumps' default separators, so
+    snapshots of tool output would depend on whether it is installed. The
+    results are cached, so the encoder's speed matters little here.
+    """
+    return json.dumps(value, indent=2 if indent else None)
 
-@app.call_tool()
-async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-    """Execute a tool."""
-    if name == "get_user":
-        user_id = arguments.get("id")
-        if not user_id:
-            raise ValueError("Missing required argument: id")
 
-        user = DATA_STORE["users"].get(user_id)
-        if not user:
-            raise ValueError(f"User not found: {user_id}")
+def _list_users_json() -> str:
+    """Return the user list as compact JSON, rebuilding only after a write."""
+    global _list_users_cache
+    if _list_users_cache is None or _list_users_cache[0] != _users_version:
+        users = USERS.to_list()
+        _list_users_cache = (_users_version, _dumps(users))
+    return _list_users_cache[1]
 
-        return [TextContent(type="text", text=json.dumps(user))]
 
-    elif name == "create_user":
-        name_val = arguments.get("name")
-        email = arguments.get("email")
+def _users_resource_json() -> str:
+    """Return the user list as indented JSON, rebuilding only after a write."""
+    global _users_resource_cache
+    if _users_resource_cache is None or _users_resource_cache[0] != _users_version:
+        users = USERS.to_list()
+        _users_resource_cache = (_users_version, _dumps(users, indent=True))
+    return _users_resource_cache[1]
 
-        if not name_val or not email:
-            raise ValueError("Missing required arguments: name and email")
 
-        # Generate new ID
-        new_id = str(len(DATA_STORE["users"]) + 1)
-        user = {"id": new_id, "name": name_val, "email": email}
-        DATA_STORE["users"][new_id] = user
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available tools."""
+    return _TOOLS_CACHE.copy()
+
+
+def _handle_get_user(arguments: dict[str, Any]) -> list[TextContent]:
+    """Get a user by ID."""
+    (user_id,) = require(arguments, "id", allow_empty=False)
+
+    cached = _get_user_json_cache.get(user_id)
+    if cached is not None:
+        return [text(cached)]
+
+    user = USERS.get(user_id)
+    if not user:
+        raise ValueError(f"User not found: {user_id}")
+
+    user_json = _get_user_json_cache[user_id] = _dumps(user)
+    return [text(user_json)]
+
+
+def _handle_create_user(arguments: dict[str, Any]) -> list[TextContent]:
+    """Create a new user."""
+    global _users_version
+
+    name_val, email = require(arguments, "name", "email", allow_empty=False)
+
+    # Generate new ID
+    new_id = str(next(_id_counter))
+    user = USERS.add(new_id, name_val, email)
+    _get_user_json_cache.pop(new_id, None)
+    _users_version += 1
 
-        return [TextContent(type="text", text=json.dumps(user))]
+    return [text(_dumps(user))]
 
-    elif name == "list_users":
-        users = list(DATA_STORE["users"].values())
-        return [TextContent(type="text", text=json.dumps(users))]
 
-    elif name == "delete_user":
-        user_id = arguments.get("id")
-        if not user_id:
-            raise ValueError("Missing required argument: id")
+def _handle_list_users(arguments: dict[str, Any]) -> list[TextContent]:
+    """List all users."""
+    return [text(_list_users_json())]
 
-        if user_id not in DATA_STORE["users"]:
-            raise ValueError(f"User not found: {user_id}")
 
-        del DATA_STORE["users"][user_id]
-        return [TextContent(type="text", text=json.dumps({"success": True}))]
+def _handle_delete_user(arguments: dict[str, Any]) -> list[TextContent]:
+    """Delete a user by ID."""
+    global _users_version
 
-    else:
-        raise ValueError(f"Unknown tool: {name}")
+    (user_id,) = require(arguments, "id", allow_empty=False)
+
+    if user_id not in USERS:
+        raise ValueError(f"User not found: {user_id}")
+
+    USERS.remove(user_id)
+    _get_user_json_cache.pop(user_id, None)
+    _users_version += 1
+    return [text(_dumps({"success": True}))]
+
+
+# Tool name -> handler, so dispatch is a single dict lookup
+_HANDLERS: dict[str, ToolHandler] = {
+    "get_user": _handle_get_user,
+    "create_user": _handle_create_user,
+    "list_users": _handle_list_users,
+    "delete_user": _handle_delete_user,
+}
+
+
+@app.call_tool()
+async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+    """Execute a tool."""
+    return dispatch(_HANDLERS, name, arguments)
 
 
 @app.list_resources()
 async def list_resources() -> list[Resource]:
     """List available resources."""
-    return [
-        Resource(
-            uri=AnyUrl("users://all"),
-            name="All Users",
-            description="List of all users in the system",
-            mimeType="application/json",
-        ),
-    ]
+    return _RESOURCES_CACHE.copy()
+
+
+memoize_static_handler(app, ListToolsRequest)
+memoize_static_handler(app, ListResourcesRequest)
 
 
 @app.read_resource()
 async def read_resource(uri: AnyUrl) -> str:
     """Read a resource."""
     if str(uri) == "users://all":
-        users = list(DATA_STORE["users"].values())
-        return json.dumps(users, indent=2)
+        return _users_resource_json()
 
     raise ValueError(f"Unknown resource: {uri}")
 
 
 async def main() -> None:
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(read_stream, write_stream, app.create_initialization_options())
+    await serve_stdio(app)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -10,11 +10,18 @@ This demonstrates advanced pytest-mcp features including:
 
 from __future__ import annotations
 
-import json
+import asyncio
+from typing import Any, AsyncIterator
 
 import pytest
+import pytest_asyncio
 from mcp import StdioServerParameters
 
+try:
+    from orjson import loads
+except ImportError:  # pragma: no cover - orjson is optional
+    from json import loads
+
 from pytest_mcp import (
     MockMCPClient,
     assert_resource_exists,
@@ -22,10 +29,14 @@ from pytest_mcp import (
     assert_tool_exists,
     assert_tool_output_matches,
     assert_tool_returns_error,
+    snapshot_bytes,
 )
 
+# Share one server process and event loop across every test in this file
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mcp_server() -> StdioServerParameters:
     """Configure the advanced server for testing."""
     return StdioServerParameters(
@@ -35,33 +46,64 @@ def mcp_server() -> StdioServerParameters:
     )
 
 
+@pytest.fixture(scope="module")
+def mcp_client(mcp_module_client: MockMCPClient) -> MockMCPClient:
+    """Reuse the module-scoped client across tests."""
+    return mcp_module_client
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def initial_users(mcp_client: MockMCPClient) -> list[dict[str, Any]]:
+    """Fetch and parse the seeded user list once for the module."""
+    result = await mcp_client.call_tool("list_users", {})
+    return loads(result.content[0].text)
+
+
+@pytest_asyncio.fixture(loop_scope="module", autouse=True)
+async def reset_users(
+    mcp_client: MockMCPClient, initial_users: list[dict[str, Any]]
+) -> AsyncIterator[None]:
+    """
+    Delete any users a test created, so the shared server starts each test clean.
+
+    This is much cheaper than respawning the server process per test.
+    """
+    yield
+
+    initial_ids = {u["id"] for u in initial_users}
+    result = await mcp_client.call_tool("list_users", {})
+    for user in loads(result.content[0].text):
+        if user["id"] not in initial_ids:
+            await mcp_client.call_tool("delete_user", {"id": user["id"]})
+
+
 class TestUserManagementServer:
     """Test suite for user management server."""
 
-    @pytest.mark.asyncio
     async def test_server_has_expected_tools(self, mcp_client: MockMCPClient) -> None:
         """Test that server provides expected tools."""
         await assert_tool_count(mcp_client, 4)
 
-        await assert_tool_exists(mcp_client, "get_user")
-        await assert_tool_exists(mcp_client, "create_user")
-        await assert_tool_exists(mcp_client, "list_users")
-        await assert_tool_exists(mcp_client, "delete_user")
+        # Independent lookups, so issue them concurrently
+        await asyncio.gather(
+            assert_tool_exists(mcp_client, "get_user"),
+            assert_tool_exists(mcp_client, "create_user"),
+            assert_tool_exists(mcp_client, "list_users"),
+            assert_tool_exists(mcp_client, "delete_user"),
+        )
 
-    @pytest.mark.asyncio
     async def test_get_user_by_id(self, mcp_client: MockMCPClient) -> None:
         """Test getting a user by ID."""
         result = await mcp_client.call_tool("get_user", {"id": "1"})
 
         # Parse JSON response
         content = result.content[0].text
-        user = json.loads(content)
+        user = loads(content)
 
         assert user["id"] == "1"
         assert user["name"] == "Alice"
         assert user["email"] == "alice@example.com"
 
-    @pytest.mark.asyncio
     async def test_get_nonexistent_user_raises_error(self, mcp_client: MockMCPClient) -> None:
         """Test that getting non-existent user raises error."""
         await assert_tool_returns_error(
@@ -71,20 +113,16 @@ class TestUserManagementServer:
             error_message="User not found",
         )
 
-    @pytest.mark.asyncio
-    async def test_list_users(self, mcp_client: MockMCPClient) -> None:
+    async def test_list_users(self, initial_users: list[dict[str, Any]]) -> None:
         """Test listing all users."""
-        result = await mcp_client.call_tool("list_users", {})
-
-        content = result.content[0].text
-        users = json.loads(content)
+        users = initial_users
 
         assert isinstance(users, list)
         assert len(users) >= 2  # At least Alice and Bob
-        assert any(u["name"] == "Alice" for u in users)
-        assert any(u["name"] == "Bob" for u in users)
+        names = {u["name"] for u in users}
+        assert "Alice" in names
+        assert "Bob" in names
 
-    @pytest.mark.asyncio
     async def test_create_user(self, mcp_client: MockMCPClient) -> None:
         """Test creating a new user."""
         result = await mcp_client.call_tool(
@@ -92,13 +130,12 @@ class TestUserManagementServer:
         )
 
         content = result.content[0].text
-        user = json.loads(content)
+        user = loads(content)
 
         assert user["name"] == "Charlie"
         assert user["email"] == "charlie@example.com"
         assert "id" in user
 
-    @pytest.mark.asyncio
     async def test_create_user_missing_arguments(self, mcp_client: MockMCPClient) -> None:
         """Test that creating user without required args fails."""
         await assert_tool_returns_error(
@@ -108,19 +145,25 @@ class TestUserManagementServer:
             error_message="Missing required arguments",
         )
 
-    @pytest.mark.asyncio
+    async def test_create_user_rejects_empty_arguments(self, mcp_client: MockMCPClient) -> None:
+        """Test that blank names and emails count as missing."""
+        result = await mcp_client.call_tool("create_user", {"name": "", "email": ""})
+
+        assert result.isError
+        assert "Missing required arguments" in result.content[0].text
+
     async def test_delete_user(self, mcp_client: MockMCPClient) -> None:
         """Test deleting a user."""
         # First create a user
         create_result = await mcp_client.call_tool(
             "create_user", {"name": "TempUser", "email": "temp@example.com"}
         )
-        user = json.loads(create_result.content[0].text)
+        user = loads(create_result.content[0].text)
         user_id = user["id"]
 
         # Delete the user
         delete_result = await mcp_client.call_tool("delete_user", {"id": user_id})
-        response = json.loads(delete_result.content[0].text)
+        response = loads(delete_result.content[0].text)
 
         assert response["success"] is True
 
@@ -129,7 +172,6 @@ class TestUserManagementServer:
             mcp_client, "get_user", {"id": user_id}, error_message="User not found"
         )
 
-    @pytest.mark.asyncio
     async def test_delete_nonexistent_user(self, mcp_client: MockMCPClient) -> None:
         """Test that deleting non-existent user raises error."""
         await assert_tool_returns_error(
@@ -143,18 +185,15 @@ class TestUserManagementServer:
 class TestUserResources:
     """Test resource functionality."""
 
-    @pytest.mark.asyncio
     async def test_server_has_resources(self, mcp_client: MockMCPClient) -> None:
         """Test that server provides resources."""
         resources = await mcp_client.list_resources()
         assert len(resources) > 0
 
-    @pytest.mark.asyncio
     async def test_users_resource_exists(self, mcp_client: MockMCPClient) -> None:
         """Test that users resource exists."""
         await assert_resource_exists(mcp_client, "users://all")
 
-    @pytest.mark.asyncio
     async def test_read_users_resource(self, mcp_client: MockMCPClient) -> None:
         """Test reading users resource."""
         result = await mcp_client.read_resource("users://all")
@@ -163,7 +202,7 @@ class TestUserResources:
         content = result.contents[0].text
 
         # Parse JSON
-        users = json.loads(content)
+        users = loads(content)
         assert isinstance(users, list)
         assert len(users) >= 2
 
@@ -171,44 +210,43 @@ class TestUserResources:
 class TestWithSnapshots:
     """Test using snapshot testing."""
 
-    @pytest.mark.asyncio
     async def test_get_user_snapshot(self, mcp_client: MockMCPClient, snapshot) -> None:
         """Test user data with snapshot."""
         result = await mcp_client.call_tool("get_user", {"id": "1"})
 
         # Save/compare snapshot
-        snapshot.assert_match(result, "user_1_data")
+        snapshot.assert_match(snapshot_bytes(result), "user_1_data")
 
-    @pytest.mark.asyncio
     async def test_list_users_snapshot(self, mcp_client: MockMCPClient, snapshot) -> None:
         """Test user list with snapshot."""
         result = await mcp_client.call_tool("list_users", {})
 
-        snapshot.assert_match(result, "all_users")
+        snapshot.assert_match(snapshot_bytes(result), "all_users")
 
 
 class TestWorkflow:
     """Test complete workflows."""
 
-    @pytest.mark.asyncio
     async def test_full_user_lifecycle(self, mcp_client: MockMCPClient) -> None:
         """Test creating, reading, and deleting a user."""
         # Create user
         create_result = await mcp_client.call_tool(
             "create_user", {"name": "TestUser", "email": "test@example.com"}
         )
-        user = json.loads(create_result.content[0].text)
+        user = loads(create_result.content[0].text)
         user_id = user["id"]
 
-        # Read user
-        get_result = await mcp_client.call_tool("get_user", {"id": user_id})
-        retrieved_user = json.loads(get_result.content[0].text)
+        # Read user and list users concurrently (both only depend on the create)
+        get_result, list_result = await asyncio.gather(
+            mcp_client.call_tool("get_user", {"id": user_id}),
+            mcp_client.call_tool("list_users", {}),
+        )
+        retrieved_user = loads(get_result.content[0].text)
         assert retrieved_user["name"] == "TestUser"
 
         # List users (should include our new user)
-        list_result = await mcp_client.call_tool("list_users", {})
-        all_users = json.loads(list_result.content[0].text)
-        assert any(u["id"] == user_id for u in all_users)
+        all_users = loads(list_result.content[0].text)
+        assert user_id in {u["id"] for u in all_users}
 
         # Delete user
         await mcp_client.call_tool("delete_user", {"id": user_id})
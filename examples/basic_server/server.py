@@ -6,18 +6,60 @@ This demonstrates a simple MCP server that can be tested with pytest-mcp.
 
 from __future__ import annotations
 
-import asyncio
 from typing import Any
 
 from mcp.server import Server
-from mcp.server.stdio import stdio_server
-from mcp.types import Tool, TextContent
-
+from mcp.types import ListToolsRequest, TextContent, Tool
+
+from examples.server_utils import (
+    ToolHandler,
+    dispatch,
+    memoize_static_handler,
+    require,
+    run,
+    serve_stdio,
+    text,
+)
 
 # Create server instance
 app = Server("example-calculator")
 
 
+# Input schemas shared by the arithmetic tools. Tool.model_construct skips
+# validation, which is safe here because the definitions are fixed
+_TWO_NUMBER_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "a": {"type": "number", "description": "First number"},
+        "b": {"type": "number", "description": "Second number"},
+    },
+    "required": ["a", "b"],
+}
+
+_DIVIDE_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "a": {"type": "number", "description": "Numerator"},
+        "b": {"type": "number", "description": "Denominator"},
+    },
+    "required": ["a", "b"],
+}
+
+# Tool definitions are static, so build them once at import time
+_TOOLS_CACHE: list[Tool] = [
+    Tool.model_construct(name="add", description="Add two numbers", inputSchema=_TWO_NUMBER_SCHEMA),
+    Tool.model_construct(
+        name="subtract", description="Subtract two numbers", inputSchema=_TWO_NUMBER_SCHEMA
+    ),
+    Tool.model_construct(
+        name="multiply", description="Multiply two numbers", inputSchema=_TWO_NUMBER_SCHEMA
+    ),
+    Tool.model_construct(
+        name="divide", description="Divide two numbers", inputSchema=_DIVIDE_SCHEMA
+    ),
+]
+
+
 @app.list_tools()
 async def list_tools() -> list[Tool]:
     """
@@ -26,56 +68,45 @@ async def list_tools() -> list[Tool]:
     Returns:
         List of calculator tools
     """
-    return [
-        Tool(
-            name="add",
-            description="Add two numbers",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "a": {"type": "number", "description": "First number"},
-                    "b": {"type": "number", "description": "Second number"},
-                },
-                "required": ["a", "b"],
-            },
-        ),
-        Tool(
-            name="subtract",
-            description="Subtract two numbers",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "a": {"type": "number", "description": "First number"},
-                    "b": {"type": "number", "description": "Second number"},
-                },
-                "required": ["a", "b"],
-            },
-        ),
-        Tool(
-            name="multiply",
-            description="Multiply two numbers",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "a": {"type": "number", "description": "First number"},
-                    "b": {"type": "number", "description": "Second number"},
-                },
-                "required": ["a", "b"],
-            },
-        ),
-        Tool(
-            name="divide",
-            description="Divide two numbers",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "a": {"type": "number", "description": "Numerator"},
-                    "b": {"type": "number", "description": "Denominator"},
-                },
-                "required": ["a", "b"],
-            },
-        ),
-    ]
+    return _TOOLS_CACHE.copy()
+
+
+memoize_static_handler(app, ListToolsRequest)
+
+
+def _handle_add(arguments: dict[str, Any]) -> list[TextContent]:
+    """Add two numbers."""
+    a, b = require(arguments, "a", "b")
+    return [text(str(a + b))]
+
+
+def _handle_subtract(arguments: dict[str, Any]) -> list[TextContent]:
+    """Subtract two numbers."""
+    a, b = require(arguments, "a", "b")
+    return [text(str(a - b))]
+
+
+def _handle_multiply(arguments: dict[str, Any]) -> list[TextContent]:
+    """Multiply two numbers."""
+    a, b = require(arguments, "a", "b")
+    return [text(str(a * b))]
+
+
+def _handle_divide(arguments: dict[str, Any]) -> list[TextContent]:
+    """Divide two numbers."""
+    a, b = require(arguments, "a", "b")
+    if b == 0:
+        raise ValueError("Cannot divide by zero")
+    return [text(str(a / b))]
+
+
+# Tool name -> handler, so dispatch is a single dict lookup
+_HANDLERS: dict[str, ToolHandler] = {
+    "add": _handle_add,
+    "subtract": _handle_subtract,
+    "multiply": _handle_multiply,
+    "divide": _handle_divide,
+}
 
 
 @app.call_tool()
@@ -93,49 +124,13 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     Raises:
         ValueError: If tool name is unknown or arguments are invalid
     """
-    if name == "add":
-        a = arguments.get("a")
-        b = arguments.get("b")
-        if a is None or b is None:
-            raise ValueError("Missing required arguments: a and b")
-        result = a + b
-        return [TextContent(type="text", text=str(result))]
-
-    elif name == "subtract":
-        a = arguments.get("a")
-        b = arguments.get("b")
-        if a is None or b is None:
-            raise ValueError("Missing required arguments: a and b")
-        result = a - b
-        return [TextContent(type="text", text=str(result))]
-
-    elif name == "multiply":
-        a = arguments.get("a")
-        b = arguments.get("b")
-        if a is None or b is None:
-            raise ValueError("Missing required arguments: a and b")
-        result = a * b
-        return [TextContent(type="text", text=str(result))]
-
-    elif name == "divide":
-        a = arguments.get("a")
-        b = arguments.get("b")
-        if a is None or b is None:
-            raise ValueError("Missing required arguments: a and b")
-        if b == 0:
-            raise ValueError("Cannot divide by zero")
-        result = a / b
-        return [TextContent(type="text", text=str(result))]
-
-    else:
-        raise ValueError(f"Unknown tool: {name}")
+    return dispatch(_HANDLERS, name, arguments)
 
 
 async def main() -> None:
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(read_stream, write_stream, app.create_initialization_options())
+    await serve_stdio(app)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -0,0 +1,118 @@
+"""
+Helpers shared by the example MCP servers.
+
+These keep the example servers focused on their tools and resources rather
+than on plumbing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from io import TextIOWrapper
+from typing import Any, Callable, Coroutine
+
+import anyio
+from mcp.server import Server
+from mcp.server.stdio import stdio_server
+from mcp.types import ServerResult, TextContent
+
+# Larger pipe buffers cut read/write syscalls for big messages
+_STDIO_BUFFER_SIZE = 128 * 1024
+
+ToolHandler = Callable[[dict[str, Any]], list[TextContent]]
+
+
+def text(value: str) -> TextContent:
+    """Build a text content block without re-running pydantic validation."""
+    return TextContent.model_construct(type="text", text=value)
+
+
+def require(arguments: dict[str, Any], *keys: str, allow_empty: bool = True) -> tuple[Any, ...]:
+    """
+    Fetch required tool arguments in one pass.
+
+    Args:
+        arguments: Tool arguments
+        keys: Names of the required arguments
+        allow_empty: If False, falsy values such as "" count as missing too
+
+    Raises:
+        ValueError: If any of the keys is missing or None (or falsy, when
+            allow_empty is False)
+    """
+    values = tuple(arguments.get(key) for key in keys)
+    if allow_empty:
+        missing = any(value is None for value in values)
+    else:
+        missing = not all(values)
+    if missing:
+        noun = "argument" if len(keys) == 1 else "arguments"
+        raise ValueError(f"Missing required {noun}: {' and '.join(keys)}")
+    return values
+
+
+def dispatch(
+    handlers: dict[str, ToolHandler], name: str, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """
+    Run the handler registered for a tool name.
+
+    Raises:
+        ValueError: If no handler is registered for the tool
+    """
+    handler = handlers.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+    return handler(arguments)
+
+
+def memoize_static_handler(app: Server[Any], request_type: type) -> None:
+    """
+    Reuse the first response built for a request whose result never changes.
+
+    The SDK's registered handler still runs once, so any bookkeeping it does
+    (such as caching tool definitions for input validation) stays intact.
+    """
+    handler = app.request_handlers[request_type]
+    cached: ServerResult | None = None
+
+    async def cached_handler(request: Any) -> ServerResult:
+        nonlocal cached
+        if cached is None:
+            cached = await handler(request)
+        return cached
+
+    app.request_handlers[request_type] = cached_handler
+
+
+def _stdio_streams() -> tuple[anyio.AsyncFile[str], anyio.AsyncFile[str]]:
+    """
+    Open stdin/stdout with large buffers for the stdio transport.
+
+    Returns:
+        Async text streams for stdin and stdout
+    """
+    stdin = open(sys.stdin.fileno(), "rb", buffering=_STDIO_BUFFER_SIZE, closefd=False)
+    stdout = open(sys.stdout.fileno(), "wb", buffering=_STDIO_BUFFER_SIZE, closefd=False)
+    return (
+        anyio.wrap_file(TextIOWrapper(stdin, encoding="utf-8", errors="replace")),
+        anyio.wrap_file(TextIOWrapper(stdout, encoding="utf-8")),
+    )
+
+
+async def serve_stdio(app: Server[Any]) -> None:
+    """Serve an MCP server over stdin/stdout."""
+    stdin, stdout = _stdio_streams()
+    async with stdio_server(stdin, stdout) as (read_stream, write_stream):
+        await app.run(read_stream, write_stream, app.create_initialization_options())
+
+
+def run(main: Coroutine[Any, Any, None]) -> None:
+    """Run a server entry point, on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main)
+    else:
+        uvloop.run(main)
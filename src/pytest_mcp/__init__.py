@@ -29,16 +29,19 @@ __all__ = [
     "MCPTestServer",
     "MCPTestServerFactory",
     # Assertions
+    "assert_tools",
     "assert_tool_exists",
     "assert_tool_count",
     "assert_tool_output_matches",
     "assert_tool_returns_error",
+    "assert_error_message_matches",
     "assert_resource_exists",
     "assert_resource_content_matches",
     "assert_tool_schema_valid",
     "assert_tools_have_unique_names",
     # Snapshot
     "SnapshotHelper",
+    "snapshot_bytes",
     # Utils
     "format_tool_signature",
     "validate_tool_arguments",
@@ -52,6 +55,7 @@ from pytest_mcp.server import MCPTestServer, MCPTestServerFactory
 
 # Assertion imports
 from pytest_mcp.assertions import (
+    assert_error_message_matches,
     assert_resource_content_matches,
     assert_resource_exists,
     assert_tool_count,
@@ -59,11 +63,12 @@ from pytest_mcp.assertions import (
     assert_tool_output_matches,
     assert_tool_returns_error,
     assert_tool_schema_valid,
+    assert_tools,
     assert_tools_have_unique_names,
 )
 
 # Snapshot imports
-from pytest_mcp.snapshot import SnapshotHelper
+from pytest_mcp.snapshot import SnapshotHelper, snapshot_bytes
 
 # Utils imports
 from pytest_mcp.utils import format_tool_signature, validate_tool_arguments
@@ -2,17 +2,44 @@
 
 from __future__ import annotations
 
-from typing import Any
+import re
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Collection, Sequence
 
-from mcp.types import CallToolResult, Tool
+from mcp.types import CallToolResult, TextResourceContents, Tool
 
 from pytest_mcp.client import MockMCPClient
+from pytest_mcp.utils import index_tools, json_loads, truncate_string
+
+# Sentinel for content items without a text attribute
+_MISSING = object()
+
+_MAX_LISTED_NAMES = 20
+_MAX_CONTENT_PREVIEW = 500
+
+
+def _text_or_item(item: Any) -> Any:
+    """Return the text of a content item, or the item itself if it has none."""
+    text = getattr(item, "text", _MISSING)
+    return item if text is _MISSING else text
+
+
+def _format_names(names: Collection[str], limit: int = _MAX_LISTED_NAMES) -> str:
+    """Join names for an error message, listing at most limit of them."""
+    listed = ", ".join(islice(names, limit))
+    if len(names) > limit:
+        listed += f", ... ({len(names) - limit} more)"
+    return listed
 
 
 async def assert_tool_exists(client: MockMCPClient, tool_name: str) -> Tool:
     """
     Assert that a tool exists on the MCP server.
 
+    Prefer assert_tools() when running several tool checks in one test.
+
     Args:
         client: MockMCPClient instance
         tool_name: Name of the tool to check
@@ -28,21 +55,84 @@ async def assert_tool_exists(client: MockMCPClient, tool_name: str) -> Tool:
         ...     tool = await assert_tool_exists(mcp_client, "calculator")
         ...     assert tool.description is not None
     """
+    tools_by_name = index_tools(await client.list_tools())
+    tool = tools_by_name.get(tool_name)
+
+    if tool is None:
+        raise AssertionError(
+            f"Tool '{tool_name}' not found. Available tools: {_format_names(tools_by_name)}"
+        )
+
+    return tool
+
+
+async def assert_tools(
+    client: MockMCPClient,
+    *,
+    exist: list[str] | None = None,
+    count: int | None = None,
+    unique: bool = False,
+    schemas_valid: bool = False,
+) -> dict[str, Tool]:
+    """
+    Run several tool assertions against a single tool listing.
+
+    Each of assert_tool_exists, assert_tool_count, assert_tools_have_unique_names
+    and assert_tool_schema_valid fetches or needs the tool list on its own;
+    this helper fetches it once and runs every requested check against it.
+
+    Args:
+        client: MockMCPClient instance
+        exist: Names of tools that must exist
+        count: Expected number of tools
+        unique: If True, checks that all tool names are unique
+        schemas_valid: If True, validates the schema of every tool
+
+    Returns:
+        Tools indexed by name
+
+    Raises:
+        AssertionError: If any check fails
+
+    Example:
+        >>> async def test_tools(mcp_client):
+        ...     await assert_tools(
+        ...         mcp_client, exist=["add", "divide"], count=4, unique=True
+        ...     )
+    """
     tools = await client.list_tools()
-    tool_names = [t.name for t in tools]
+    tools_by_name = index_tools(tools)
+
+    for tool_name in exist or ():
+        if tool_name not in tools_by_name:
+            raise AssertionError(
+                f"Tool '{tool_name}' not found. Available tools: {_format_names(tools_by_name)}"
+            )
 
-    if tool_name not in tool_names:
+    if count is not None and len(tools) != count:
         raise AssertionError(
-            f"Tool '{tool_name}' not found. Available tools: {', '.join(tool_names)}"
+            f"Expected {count} tools, found {len(tools)}: "
+            f"{_format_names([t.name for t in tools])}"
         )
 
-    return next(t for t in tools if t.name == tool_name)
+    if unique and len(tools_by_name) != len(tools):
+        counts = Counter(t.name for t in tools)
+        duplicates = [name for name, n in counts.items() if n > 1]
+        raise AssertionError(f"Duplicate tool names found: {', '.join(duplicates)}")
+
+    if schemas_valid:
+        for tool in tools:
+            assert_tool_schema_valid(tool)
+
+    return tools_by_name
 
 
 async def assert_tool_count(client: MockMCPClient, expected_count: int) -> None:
     """
     Assert that the server has exactly the expected number of tools.
 
+    Prefer assert_tools() when running several tool checks in one test.
+
     Args:
         client: MockMCPClient instance
         expected_count: Expected number of tools
@@ -58,10 +148,9 @@ async def assert_tool_count(client: MockMCPClient, expected_count: int) -> None:
     actual_count = len(tools)
 
     if actual_count != expected_count:
-        tool_names = [t.name for t in tools]
         raise AssertionError(
             f"Expected {expected_count} tools, found {actual_count}: "
-            f"{', '.join(tool_names)}"
+            f"{_format_names([t.name for t in tools])}"
         )
 
 
@@ -89,54 +178,101 @@ async def assert_tool_output_matches(
     if not result.content:
         raise AssertionError(f"Tool returned no content. Result: {result}")
 
-    # Extract actual value from result
-    actual = None
-    if len(result.content) == 1:
-        content_item = result.content[0]
-        if hasattr(content_item, "text"):
-            actual = content_item.text
-        else:
-            actual = content_item
+    # Extract actual value from result; most tools return a single text item
+    content = result.content
+    if len(content) == 1:
+        actual = _text_or_item(content[0])
     else:
-        actual = [
-            item.text if hasattr(item, "text") else item for item in result.content
-        ]
+        actual = list(map(_text_or_item, content))
+
+    # Compare values with the matcher specialized for this expected type
+    matcher = _OUTPUT_MATCHERS.get((type(expected), partial))
+    if matcher is None:
+        matcher = _match_partial_fallback if partial else _match_exact_fallback
+    matcher(actual, expected)
+
+
+def _match_partial_dict(actual: Any, expected: dict[str, Any]) -> None:
+    """Check that every expected key/value pair is present in actual."""
+    if not isinstance(actual, dict):
+        _match_partial_unsupported(actual, expected)
+    for key, value in expected.items():
+        if key not in actual:
+            raise AssertionError(f"Expected key '{key}' not found in result. Actual: {actual}")
+        if actual[key] != value:
+            raise AssertionError(f"Expected {key}={value}, got {key}={actual[key]}")
+
+
+def _match_partial_str(actual: Any, expected: str) -> None:
+    """Check that expected is a substring of actual."""
+    if not isinstance(actual, str):
+        _match_partial_unsupported(actual, expected)
+    if expected not in actual:
+        raise AssertionError(f"Expected substring '{expected}' not found in '{actual}'")
+
+
+def _match_partial_unsupported(actual: Any, expected: Any) -> None:
+    """Reject partial matching for types that have no notion of it."""
+    raise AssertionError(
+        f"Partial matching not supported for types {type(expected)} and {type(actual)}"
+    )
+
+
+def _match_partial_fallback(actual: Any, expected: Any) -> None:
+    """Partial matching for subclasses of the types in _OUTPUT_MATCHERS."""
+    if isinstance(expected, dict):
+        _match_partial_dict(actual, expected)
+    elif isinstance(expected, str):
+        _match_partial_str(actual, expected)
+    else:
+        _match_partial_unsupported(actual, expected)
 
-    # Compare values
-    if partial:
-        if isinstance(expected, dict) and isinstance(actual, dict):
-            for key, value in expected.items():
-                if key not in actual:
-                    raise AssertionError(
-                        f"Expected key '{key}' not found in result. Actual: {actual}"
-                    )
-                if actual[key] != value:
-                    raise AssertionError(
-                        f"Expected {key}={value}, got {key}={actual[key]}"
-                    )
-        elif isinstance(expected, str) and isinstance(actual, str):
-            if expected not in actual:
-                raise AssertionError(
-                    f"Expected substring '{expected}' not found in '{actual}'"
-                )
-        else:
-            raise AssertionError(
-                f"Partial matching not supported for types {type(expected)} and {type(actual)}"
-            )
+
+def _match_exact(actual: Any, expected: Any) -> None:
+    """Check that actual equals expected."""
+    if actual != expected:
+        raise AssertionError(f"Tool output mismatch.\nExpected: {expected}\nActual: {actual}")
+
+
+def _match_exact_json(actual: Any, expected: dict[str, Any] | list[Any]) -> None:
+    """Check equality, parsing actual as JSON when it can match expected's shape."""
+    # Skip text that cannot be a JSON object/array in the first place
+    if isinstance(actual, (str, bytes)) and _json_opener(actual) == (
+        "{" if isinstance(expected, dict) else "["
+    ):
+        try:
+            actual = json_loads(actual)
+        except ValueError:
+            # json.JSONDecodeError and UnicodeDecodeError both derive from it
+            pass
+    _match_exact(actual, expected)
+
+
+def _match_exact_fallback(actual: Any, expected: Any) -> None:
+    """Exact matching for types not listed in _OUTPUT_MATCHERS."""
+    if isinstance(expected, (dict, list)):
+        _match_exact_json(actual, expected)
     else:
-        # Try to parse actual as JSON if expected is dict/list
-        if isinstance(expected, (dict, list)) and isinstance(actual, str):
-            import json
+        _match_exact(actual, expected)
 
-            try:
-                actual = json.loads(actual)
-            except json.JSONDecodeError:
-                pass
 
-        if actual != expected:
-            raise AssertionError(
-                f"Tool output mismatch.\nExpected: {expected}\nActual: {actual}"
-            )
+# (type(expected), partial) -> matcher
+_OUTPUT_MATCHERS: dict[tuple[type, bool], Callable[[Any, Any], None]] = {
+    (str, False): _match_exact,
+    (int, False): _match_exact,
+    (float, False): _match_exact,
+    (bool, False): _match_exact,
+    (dict, False): _match_exact_json,
+    (list, False): _match_exact_json,
+    (dict, True): _match_partial_dict,
+    (str, True): _match_partial_str,
+}
+
+
+def _json_opener(text: str | bytes) -> str:
+    """Return the first non-whitespace character of text, or '' if blank."""
+    first = text.lstrip()[:1]
+    return first.decode() if isinstance(first, bytes) else first
 
 
 async def assert_tool_returns_error(
@@ -171,9 +307,7 @@ async def assert_tool_returns_error(
     """
     try:
         await client.call_tool(tool_name, arguments)
-        raise AssertionError(
-            f"Tool '{tool_name}' was expected to raise an error but succeeded"
-        )
+        raise AssertionError(f"Tool '{tool_name}' was expected to raise an error but succeeded")
     except AssertionError:
         raise
     except Exception as e:
@@ -186,6 +320,76 @@ async def assert_tool_returns_error(
         return e
 
 
+@lru_cache(maxsize=128)
+def _compile_needles(needles: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile literal needles into a single alternation pattern."""
+    return re.compile("|".join(map(re.escape, needles)))
+
+
+def _multi_substring_match(haystack: str, needles: Sequence[str]) -> str | None:
+    """
+    Find the first of several literal substrings in a string.
+
+    All needles are searched in a single pass with one compiled pattern,
+    which is cached for repeated use with the same needles.
+
+    Args:
+        haystack: String to search
+        needles: Substrings to look for
+
+    Returns:
+        The matching substring, or None if no needle occurs
+    """
+    if not needles:
+        return None
+    if len(needles) == 1:
+        return needles[0] if needles[0] in haystack else None
+
+    match = _compile_needles(tuple(needles)).search(haystack)
+    return match.group(0) if match else None
+
+
+async def assert_error_message_matches(
+    client: MockMCPClient,
+    tool_name: str,
+    arguments: dict[str, Any] | None = None,
+    *,
+    needles: Sequence[str],
+) -> Exception:
+    """
+    Assert that calling a tool raises an error mentioning any of several substrings.
+
+    Args:
+        client: MockMCPClient instance
+        tool_name: Name of the tool to call
+        arguments: Tool arguments
+        needles: Accepted error message substrings
+
+    Returns:
+        The caught exception
+
+    Raises:
+        AssertionError: If tool doesn't raise an error or no substring matches
+
+    Example:
+        >>> await assert_error_message_matches(
+        ...     mcp_client,
+        ...     "divide",
+        ...     {"a": 1, "b": 0},
+        ...     needles=["division by zero", "Cannot divide by zero"],
+        ... )
+    """
+    error = await assert_tool_returns_error(client, tool_name, arguments)
+
+    if _multi_substring_match(str(error), needles) is None:
+        raise AssertionError(
+            f"Tool '{tool_name}' raised error but message doesn't match.\n"
+            f"Expected any of: {', '.join(needles)}\n"
+            f"Actual error: {error}"
+        ) from error
+    return error
+
+
 async def assert_resource_exists(client: MockMCPClient, resource_uri: str) -> None:
     """
     Assert that a resource exists on the MCP server.
@@ -201,13 +405,13 @@ async def assert_resource_exists(client: MockMCPClient, resource_uri: str) -> No
         >>> async def test_resource_exists(mcp_client):
         ...     await assert_resource_exists(mcp_client, "file:///path/to/file.txt")
     """
-    resources = await client.list_resources()
-    resource_uris = [str(r.uri) for r in resources]
-
-    if resource_uri not in resource_uris:
+    # Looked up through the client's URI index, which is cached along with
+    # the listing; the full URI list is only built for the failure message
+    if await client.get_resource(resource_uri) is None:
+        available = dict.fromkeys(str(r.uri) for r in await client.list_resources())
         raise AssertionError(
             f"Resource '{resource_uri}' not found. "
-            f"Available resources: {', '.join(resource_uris)}"
+            f"Available resources: {_format_names(available)}"
         )
 
 
@@ -242,21 +446,32 @@ async def assert_resource_content_matches(
     if not result.contents:
         raise AssertionError(f"Resource '{resource_uri}' returned no content")
 
-    actual_content = result.contents[0].text if result.contents[0].text else ""
+    content = result.contents[0]
+    if not isinstance(content, TextResourceContents):
+        mime_type = content.mimeType or "no mime type"
+        raise AssertionError(
+            f"Resource '{resource_uri}' returned binary content ({mime_type}), expected text"
+        )
+    actual_content = content.text
 
+    # str comparison and containment already run at memcmp/fastsearch speed;
+    # only the failure messages need care so large resources stay readable
     if partial:
         if expected_content not in actual_content:
             raise AssertionError(
                 f"Expected substring not found in resource '{resource_uri}'.\n"
-                f"Expected: {expected_content}\n"
-                f"Actual: {actual_content}"
+                f"Expected: {truncate_string(expected_content, _MAX_CONTENT_PREVIEW)}\n"
+                f"Actual ({len(actual_content)} chars): "
+                f"{truncate_string(actual_content, _MAX_CONTENT_PREVIEW)}"
             )
     else:
         if actual_content != expected_content:
             raise AssertionError(
                 f"Resource content mismatch for '{resource_uri}'.\n"
-                f"Expected: {expected_content}\n"
-                f"Actual: {actual_content}"
+                f"Expected ({len(expected_content)} chars): "
+                f"{truncate_string(expected_content, _MAX_CONTENT_PREVIEW)}\n"
+                f"Actual ({len(actual_content)} chars): "
+                f"{truncate_string(actual_content, _MAX_CONTENT_PREVIEW)}"
             )
 
 
@@ -291,15 +506,15 @@ def assert_tool_schema_valid(tool: Tool) -> None:
         )
 
     if "type" not in schema:
-        raise AssertionError(
-            f"Tool '{tool.name}' input schema must have a 'type' field"
-        )
+        raise AssertionError(f"Tool '{tool.name}' input schema must have a 'type' field")
 
 
 async def assert_tools_have_unique_names(client: MockMCPClient) -> None:
     """
     Assert that all tools have unique names.
 
+    Prefer assert_tools() when running several tool checks in one test.
+
     Args:
         client: MockMCPClient instance
 
@@ -311,11 +526,8 @@ async def assert_tools_have_unique_names(client: MockMCPClient) -> None:
         ...     await assert_tools_have_unique_names(mcp_client)
     """
     tools = await client.list_tools()
-    tool_names = [t.name for t in tools]
-    unique_names = set(tool_names)
+    counts = Counter(t.name for t in tools)
+    duplicates = [name for name, count in counts.items() if count > 1]
 
-    if len(tool_names) != len(unique_names):
-        duplicates = [name for name in tool_names if tool_names.count(name) > 1]
-        raise AssertionError(
-            f"Duplicate tool names found: {', '.join(set(duplicates))}"
-        )
+    if duplicates:
+        raise AssertionError(f"Duplicate tool names found: {', '.join(duplicates)}")
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager, AsyncExitStack
-from typing import Any, AsyncIterator, Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, AsyncIterator, Sequence
 
 import anyio
-from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 from mcp.types import (
@@ -20,9 +21,21 @@ from mcp.types import (
 )
 from pydantic import AnyUrl
 
+from pytest_mcp.utils import index_tools
+
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
+    from mcp.server.lowlevel import Server
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _to_any_url(uri: str) -> AnyUrl:
+    """Parse a URI string, reusing the result for repeated URIs."""
+    return AnyUrl(uri)
+
+
 class MockMCPClient:
     """
     A mock MCP client for testing MCP servers in-process.
@@ -34,6 +47,10 @@ class MockMCPClient:
         >>> async with MockMCPClient(server) as client:
         ...     tools = await client.list_tools()
         ...     result = await client.call_tool("my_tool", {"arg": "value"})
+        >>>
+        >>> # Run a server defined in the test process, without a subprocess
+        >>> async with MockMCPClient(server_object=app) as client:
+        ...     tools = await client.list_tools()
     """
 
     def __init__(
@@ -43,6 +60,8 @@ class MockMCPClient:
         command: str | None = None,
         args: Sequence[str] | None = None,
         env: dict[str, str] | None = None,
+        server_object: Server[Any] | FastMCP | None = None,
+        cache_listings: bool = False,
     ) -> None:
         """
         Initialize the mock MCP client.
@@ -52,19 +71,31 @@ class MockMCPClient:
             command: Server command to run (alternative to server_params)
             args: Command arguments (alternative to server_params)
             env: Environment variables (alternative to server_params)
+            server_object: MCP Server (or FastMCP) instance to run in-process
+                over memory streams instead of spawning a subprocess
+            cache_listings: Cache list_tools()/list_resources() results until
+                the next call_tool(), invalidate_cache() or disconnect()
         """
-        if server_params is None:
+        if server_params is None and server_object is None:
             if command is None:
-                raise ValueError("Either server_params or command must be provided")
+                raise ValueError(
+                    "Either server_params or command must be provided, "
+                    "or a server_object to run in-process"
+                )
             server_params = StdioServerParameters(
-                command=command, args=args or [], env=env or {}
+                command=command, args=list(args or []), env=env or {}
             )
 
         self._server_params = server_params
+        self._server_object = server_object
         self._session: ClientSession | None = None
-        self._read_stream: MemoryObjectReceiveStream[Any] | None = None
-        self._write_stream: MemoryObjectSendStream[Any] | None = None
-        self._exit_stack: AsyncExitStack | None = None
+        self._connection_task: asyncio.Task[None] | None = None
+        self._closing = asyncio.Event()
+        self._cache_listings = cache_listings
+        self._tools_cache: list[Tool] | None = None
+        self._resources_cache: list[Resource] | None = None
+        self._tools_by_name: dict[str, Tool] | None = None
+        self._resources_by_uri: dict[str, Resource] | None = None
 
     async def __aenter__(self) -> MockMCPClient:
         """Enter async context and initialize connection."""
@@ -81,47 +112,75 @@ class MockMCPClient:
             logger.warning("Client is already connected")
             return
 
-        try:
-            # Use AsyncExitStack to manage nested context managers
-            self._exit_stack = AsyncExitStack()
+        ready: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._closing = asyncio.Event()
+        self._connection_task = asyncio.create_task(self._run_connection(ready))
 
-            # Enter stdio_client context and keep it alive
-            read, write = await self._exit_stack.enter_async_context(
-                stdio_client(self._server_params)
-            )
-            self._read_stream = read
-            self._write_stream = write
+        try:
+            await ready
+            logger.debug("MockMCPClient connected successfully")
+        except BaseException as e:
+            self._closing.set()
+            self._connection_task.cancel()
+            self._connection_task = None
+            if not isinstance(e, Exception):
+                raise
+            logger.error(f"Failed to connect to MCP server: {e}")
+            raise ConnectionError(f"Could not connect to MCP server: {e}") from e
 
-            # Enter ClientSession context and keep it alive
-            session = await self._exit_stack.enter_async_context(
-                ClientSession(read, write)
-            )
-            self._session = session
+    async def _run_connection(self, ready: asyncio.Future[None]) -> None:
+        """
+        Own the transport and session for the lifetime of the connection.
 
-            # Initialize the session
-            await session.initialize()
-            logger.debug("MockMCPClient connected successfully")
+        anyio cancel scopes must be exited by the task that entered them, but
+        callers such as pytest-asyncio fixtures may connect and disconnect
+        from different tasks. Running the contexts in a dedicated task keeps
+        entry and exit together.
 
-        except Exception as e:
-            # Clean up on error
-            if self._exit_stack:
-                await self._exit_stack.aclose()
-                self._exit_stack = None
+        Args:
+            ready: Future resolved once the session is initialized
+        """
+        try:
+            async with AsyncExitStack() as stack:
+                if self._server_object is not None:
+                    from mcp.shared.memory import (
+                        create_connected_server_and_client_session,
+                    )
+
+                    # Runs the server in this event loop; the session comes
+                    # back already initialized
+                    session = await stack.enter_async_context(
+                        create_connected_server_and_client_session(self._server_object)
+                    )
+                else:
+                    # __init__ guarantees params whenever there is no server object
+                    assert self._server_params is not None
+                    read, write = await stack.enter_async_context(stdio_client(self._server_params))
+                    session = await stack.enter_async_context(ClientSession(read, write))
+                    await session.initialize()
+
+                self._session = session
+                ready.set_result(None)
+
+                await self._closing.wait()
+        except BaseException as e:
+            if ready.done():
+                raise
+            ready.set_exception(e)
+        finally:
             self._session = None
-            self._read_stream = None
-            self._write_stream = None
-            logger.error(f"Failed to connect to MCP server: {e}")
-            raise ConnectionError(f"Could not connect to MCP server: {e}") from e
 
     async def disconnect(self) -> None:
         """Close connection to the MCP server."""
-        if self._exit_stack:
-            await self._exit_stack.aclose()
-            self._exit_stack = None
-        self._session = None
-        self._read_stream = None
-        self._write_stream = None
-        logger.debug("MockMCPClient disconnected")
+        task = self._connection_task
+        self._connection_task = None
+        try:
+            if task is not None:
+                self._closing.set()
+                await task
+        finally:
+            self.invalidate_cache()
+            logger.debug("MockMCPClient disconnected")
 
     @property
     def is_connected(self) -> bool:
@@ -136,6 +195,13 @@ class MockMCPClient:
             )
         return self._session
 
+    def invalidate_cache(self) -> None:
+        """Drop cached tool and resource listings."""
+        self._tools_cache = None
+        self._resources_cache = None
+        self._tools_by_name = None
+        self._resources_by_uri = None
+
     async def list_tools(self) -> list[Tool]:
         """
         List all available tools from the MCP server.
@@ -146,13 +212,17 @@ class MockMCPClient:
         Raises:
             RuntimeError: If client is not connected
         """
+        # Hand out copies so callers can't mutate the cached listing
+        if self._tools_cache is not None:
+            return list(self._tools_cache)
+
         session = self._ensure_connected()
         result: ListToolsResult = await session.list_tools()
+        if self._cache_listings:
+            self._tools_cache = list(result.tools)
         return result.tools
 
-    async def call_tool(
-        self, name: str, arguments: dict[str, Any] | None = None
-    ) -> CallToolResult:
+    async def call_tool(self, name: str, arguments: dict[str, Any] | None = None) -> CallToolResult:
         """
         Call a tool on the MCP server.
 
@@ -168,6 +238,8 @@ class MockMCPClient:
             Exception: If tool execution fails
         """
         session = self._ensure_connected()
+        # Tool calls may change the server's state, including its listings
+        self.invalidate_cache()
         try:
             result = await session.call_tool(name, arguments or {})
             logger.debug(f"Tool '{name}' called successfully")
@@ -186,8 +258,14 @@ class MockMCPClient:
         Raises:
             RuntimeError: If client is not connected
         """
+        # Hand out copies so callers can't mutate the cached listing
+        if self._resources_cache is not None:
+            return list(self._resources_cache)
+
         session = self._ensure_connected()
         result: ListResourcesResult = await session.list_resources()
+        if self._cache_listings:
+            self._resources_cache = list(result.resources)
         return result.resources
 
     async def read_resource(self, uri: str | AnyUrl) -> ReadResourceResult:
@@ -207,7 +285,7 @@ class MockMCPClient:
         session = self._ensure_connected()
         try:
             if isinstance(uri, str):
-                uri = AnyUrl(uri)
+                uri = _to_any_url(uri)
             result = await session.read_resource(uri)
             logger.debug(f"Resource '{uri}' read successfully")
             return result
@@ -215,6 +293,68 @@ class MockMCPClient:
             logger.error(f"Resource '{uri}' read failed: {e}")
             raise
 
+    async def ping(self) -> None:
+        """
+        Send an MCP ping and wait for the server's reply.
+
+        Raises:
+            RuntimeError: If client is not connected
+        """
+        session = self._ensure_connected()
+        await session.send_ping()
+
+    async def batch(self) -> tuple[list[Tool], list[Resource]]:
+        """
+        Fetch the tool and resource listings concurrently.
+
+        Returns:
+            Tuple of (tools, resources)
+
+        Raises:
+            RuntimeError: If client is not connected
+
+        Example:
+            >>> tools, resources = await client.batch()
+        """
+        tools, resources = await asyncio.gather(self.list_tools(), self.list_resources())
+        return tools, resources
+
+    async def _get_tools_by_name(self) -> dict[str, Tool]:
+        """
+        Get available tools indexed by name.
+
+        The first tool wins if the server reports duplicate names.
+
+        Returns:
+            Mapping of tool name to tool
+        """
+        if self._tools_by_name is not None:
+            return self._tools_by_name
+
+        index = index_tools(await self.list_tools())
+        if self._cache_listings:
+            self._tools_by_name = index
+        return index
+
+    async def _get_resources_by_uri(self) -> dict[str, Resource]:
+        """
+        Get available resources indexed by URI string.
+
+        The first resource wins if the server reports duplicate URIs.
+
+        Returns:
+            Mapping of resource URI to resource
+        """
+        if self._resources_by_uri is not None:
+            return self._resources_by_uri
+
+        index: dict[str, Resource] = {}
+        for resource in await self.list_resources():
+            index.setdefault(str(resource.uri), resource)
+        if self._cache_listings:
+            self._resources_by_uri = index
+        return index
+
     async def get_tool(self, name: str) -> Tool | None:
         """
         Get a specific tool by name.
@@ -225,8 +365,7 @@ class MockMCPClient:
         Returns:
             Tool if found, None otherwise
         """
-        tools = await self.list_tools()
-        return next((tool for tool in tools if tool.name == name), None)
+        return (await self._get_tools_by_name()).get(name)
 
     async def get_resource(self, uri: str | AnyUrl) -> Resource | None:
         """
@@ -238,13 +377,12 @@ class MockMCPClient:
         Returns:
             Resource if found, None otherwise
         """
-        if isinstance(uri, str):
-            uri = AnyUrl(uri)
-
-        resources = await self.list_resources()
-        return next(
-            (resource for resource in resources if resource.uri == uri), None
-        )
+        resources_by_uri = await self._get_resources_by_uri()
+        resource = resources_by_uri.get(str(uri))
+        if resource is None and isinstance(uri, str):
+            # Fall back to the normalized form, e.g. with a trailing slash added
+            resource = resources_by_uri.get(str(_to_any_url(uri)))
+        return resource
 
 
 @asynccontextmanager
@@ -254,6 +392,7 @@ async def create_mock_client(
     command: str | None = None,
     args: Sequence[str] | None = None,
     env: dict[str, str] | None = None,
+    cache_listings: bool = False,
 ) -> AsyncIterator[MockMCPClient]:
     """
     Create a mock MCP client as an async context manager.
@@ -265,6 +404,7 @@ async def create_mock_client(
         command: Server command (alternative to server_params)
         args: Command arguments
         env: Environment variables
+        cache_listings: Cache tool and resource listings between tool calls
 
     Yields:
         Connected MockMCPClient instance
@@ -273,6 +413,12 @@ async def create_mock_client(
         >>> async with create_mock_client(command="python", args=["server.py"]) as client:
         ...     tools = await client.list_tools()
     """
-    client = MockMCPClient(server_params, command=command, args=args, env=env)
+    client = MockMCPClient(
+        server_params,
+        command=command,
+        args=args,
+        env=env,
+        cache_listings=cache_listings,
+    )
     async with client:
         yield client
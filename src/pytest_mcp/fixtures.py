@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, AsyncIterator
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator
 
 import pytest
 from mcp import StdioServerParameters
@@ -13,8 +13,85 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
+def _coerce_server_params(
+    mcp_server: Any, base_env: dict[str, str] | None = None
+) -> StdioServerParameters:
+    """
+    Normalize a user-defined mcp_server fixture value into server parameters.
+
+    Args:
+        mcp_server: StdioServerParameters, dict, or (command, args, env) tuple
+        base_env: Environment variables the server's own env is layered on top of
+
+    Returns:
+        StdioServerParameters for the server
+
+    Raises:
+        TypeError: If mcp_server is of an unsupported type
+    """
+    if isinstance(mcp_server, StdioServerParameters):
+        if not base_env:
+            return mcp_server
+        return mcp_server.model_copy(update={"env": {**base_env, **(mcp_server.env or {})}})
+    if isinstance(mcp_server, dict):
+        # Support dict format: {"command": "python", "args": ["server.py"]}
+        if base_env:
+            mcp_server = {**mcp_server, "env": {**base_env, **(mcp_server.get("env") or {})}}
+        return StdioServerParameters(**mcp_server)
+    if isinstance(mcp_server, tuple) and len(mcp_server) >= 1:
+        # Support tuple format: ("python", ["server.py"])
+        command = mcp_server[0]
+        args = mcp_server[1] if len(mcp_server) > 1 else []
+        env = mcp_server[2] if len(mcp_server) > 2 else None
+        if base_env:
+            env = {**base_env, **(env or {})}
+        return StdioServerParameters(command=command, args=args, env=env or {})
+
+    raise TypeError(
+        f"mcp_server fixture must return StdioServerParameters, dict, or tuple, "
+        f"got {type(mcp_server)}"
+    )
+
+
+# Last (mcp_server value, normalized parameters) pair seen in this session
+_server_params_key = pytest.StashKey[tuple[Any, StdioServerParameters]]()
+
+
+def _session_server_params(
+    request: pytest.FixtureRequest,
+    mcp_server: Any,
+    base_env: dict[str, str] | None = None,
+) -> StdioServerParameters:
+    """
+    Normalize mcp_server, reusing the result while the fixture value is unchanged.
+
+    Module or session scoped mcp_server fixtures hand every test the same
+    object, so it only needs to be normalized once.
+
+    Args:
+        request: Pytest fixture request
+        mcp_server: StdioServerParameters, dict, or (command, args, env) tuple
+        base_env: Environment variables the server's own env is layered on top of
+
+    Returns:
+        StdioServerParameters for the server
+    """
+    if base_env:
+        return _coerce_server_params(mcp_server, base_env)
+
+    cached = request.session.stash.get(_server_params_key, None)
+    if cached is not None and cached[0] is mcp_server:
+        return cached[1]
+
+    server_params = _coerce_server_params(mcp_server)
+    request.session.stash[_server_params_key] = (mcp_server, server_params)
+    return server_params
+
+
 @pytest.fixture
-async def mcp_client(mcp_server: Any) -> AsyncIterator[MockMCPClient]:
+async def mcp_client(
+    request: pytest.FixtureRequest, mcp_server: Any
+) -> AsyncIterator[MockMCPClient]:
     """
     Pytest fixture that provides a connected MockMCPClient.
 
@@ -22,6 +99,7 @@ async def mcp_client(mcp_server: Any) -> AsyncIterator[MockMCPClient]:
     and creates a client connected to it.
 
     Args:
+        request: Pytest fixture request
         mcp_server: User-defined fixture that returns server parameters
 
     Yields:
@@ -38,28 +116,87 @@ async def mcp_client(mcp_server: Any) -> AsyncIterator[MockMCPClient]:
         ...     tools = await mcp_client.list_tools()
         ...     assert len(tools) > 0
     """
-    # Handle different types of mcp_server fixtures
-    if isinstance(mcp_server, StdioServerParameters):
-        server_params = mcp_server
-    elif isinstance(mcp_server, dict):
-        # Support dict format: {"command": "python", "args": ["server.py"]}
-        server_params = StdioServerParameters(**mcp_server)
-    elif isinstance(mcp_server, tuple) and len(mcp_server) >= 1:
-        # Support tuple format: ("python", ["server.py"])
-        command = mcp_server[0]
-        args = mcp_server[1] if len(mcp_server) > 1 else []
-        env = mcp_server[2] if len(mcp_server) > 2 else None
-        server_params = StdioServerParameters(command=command, args=args, env=env or {})
-    else:
-        raise TypeError(
-            f"mcp_server fixture must return StdioServerParameters, dict, or tuple, "
-            f"got {type(mcp_server)}"
-        )
+    server_params = _session_server_params(request, mcp_server)
 
     async with MockMCPClient(server_params) as client:
         yield client
 
 
+@pytest.fixture(scope="module")
+async def mcp_module_client(mcp_server: Any) -> AsyncIterator[MockMCPClient]:
+    """
+    Module-scoped variant of mcp_client that shares one server process.
+
+    The server subprocess is spawned and initialized once per test module
+    instead of once per test. The mcp_server fixture must be module or
+    session scoped, the server must not depend on per-test state, and the
+    tests must run on a module-scoped event loop, e.g. with
+    ``pytestmark = pytest.mark.asyncio(loop_scope="module")``.
+
+    Args:
+        mcp_server: User-defined fixture that returns server parameters
+
+    Yields:
+        Connected MockMCPClient instance shared by the module
+
+    Example:
+        >>> @pytest.fixture(scope="module")
+        >>> def mcp_server():
+        ...     return StdioServerParameters(command="python", args=["server.py"])
+        >>>
+        >>> async def test_my_tool(mcp_module_client):
+        ...     tools = await mcp_module_client.list_tools()
+    """
+    async with MockMCPClient(_coerce_server_params(mcp_server), cache_listings=True) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+async def mcp_session_client(mcp_server: Any) -> AsyncIterator[MockMCPClient]:
+    """
+    Session-scoped variant of mcp_client that shares one server process.
+
+    The server subprocess is spawned and initialized once for the whole test
+    run. This trades test isolation for speed: any state the server keeps
+    leaks between tests, so only use it for servers whose tools do not
+    depend on earlier calls. The mcp_server fixture must be session scoped
+    and the tests must run on a session-scoped event loop, e.g. with
+    ``pytestmark = pytest.mark.asyncio(loop_scope="session")``.
+
+    Tool and resource listings are cached on the client and dropped after
+    every test.
+
+    Args:
+        mcp_server: User-defined fixture that returns server parameters
+
+    Yields:
+        Connected MockMCPClient instance shared by the session
+
+    Example:
+        >>> @pytest.fixture(scope="session")
+        >>> def mcp_server():
+        ...     return StdioServerParameters(command="python", args=["server.py"])
+        >>>
+        >>> async def test_my_tool(mcp_session_client):
+        ...     tools = await mcp_session_client.list_tools()
+    """
+    async with MockMCPClient(_coerce_server_params(mcp_server), cache_listings=True) as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def _mcp_shared_client_cache_reset(
+    request: pytest.FixtureRequest,
+) -> Iterator[None]:
+    """Drop listing caches of shared clients so they don't leak across tests."""
+    yield
+    funcargs = getattr(request.node, "funcargs", {})
+    for name in ("mcp_module_client", "mcp_session_client"):
+        client = funcargs.get(name)
+        if isinstance(client, MockMCPClient):
+            client.invalidate_cache()
+
+
 @pytest.fixture
 def snapshot_dir(request: pytest.FixtureRequest) -> Path:
     """
@@ -75,7 +212,7 @@ def snapshot_dir(request: pytest.FixtureRequest) -> Path:
     """
     from pathlib import Path
 
-    test_file = Path(request.fspath)
+    test_file = Path(request.path)
     return test_file.parent / "__snapshots__"
 
 
@@ -111,7 +248,7 @@ def mcp_server_env() -> dict[str, str]:
 
 @pytest.fixture
 async def mcp_test_server(
-    mcp_server: Any, mcp_server_env: dict[str, str]
+    request: pytest.FixtureRequest, mcp_server: Any, mcp_server_env: dict[str, str]
 ) -> AsyncIterator[MockMCPClient]:
     """
     Advanced fixture that provides full server lifecycle management.
@@ -120,6 +257,7 @@ async def mcp_test_server(
     more control over the server lifecycle.
 
     Args:
+        request: Pytest fixture request
         mcp_server: User-defined server parameters
         mcp_server_env: Environment variables
 
@@ -133,22 +271,30 @@ async def mcp_test_server(
     """
     from pytest_mcp.server import MCPTestServer
 
-    # Parse server parameters
-    if isinstance(mcp_server, StdioServerParameters):
-        command = mcp_server.command
-        args = mcp_server.args
-        env = {**mcp_server_env, **mcp_server.env}
-    elif isinstance(mcp_server, dict):
-        command = mcp_server["command"]
-        args = mcp_server.get("args", [])
-        env = {**mcp_server_env, **mcp_server.get("env", {})}
-    elif isinstance(mcp_server, tuple):
-        command = mcp_server[0]
-        args = mcp_server[1] if len(mcp_server) > 1 else []
-        env = {**mcp_server_env, **(mcp_server[2] if len(mcp_server) > 2 else {})}
-    else:
-        raise TypeError(f"Unsupported mcp_server type: {type(mcp_server)}")
-
-    async with MCPTestServer(command, args, env) as server:
+    server_params = _session_server_params(request, mcp_server, mcp_server_env)
+    async with MCPTestServer.from_params(server_params) as server:
         client = server.get_client()
         yield client
+
+
+@pytest.fixture(scope="session")
+async def mcp_session_test_server(mcp_server: Any) -> AsyncIterator[MockMCPClient]:
+    """
+    Session-scoped variant of mcp_test_server.
+
+    The server is started once for the whole test run and stopped at the
+    end of the session. As with mcp_session_client, server state is shared
+    by every test using it. The function-scoped mcp_server_env fixture is
+    not applied; put environment variables in the mcp_server parameters.
+
+    Args:
+        mcp_server: User-defined session-scoped server parameters
+
+    Yields:
+        Connected MockMCPClient instance shared by the session
+    """
+    from pytest_mcp.server import MCPTestServer
+
+    server_params = _coerce_server_params(mcp_server)
+    async with MCPTestServer.from_params(server_params) as server:
+        yield server.get_client()
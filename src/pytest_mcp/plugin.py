@@ -2,25 +2,41 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
 import pytest
 
 from pytest_mcp.fixtures import (
+    _mcp_shared_client_cache_reset,
     mcp_client,
+    mcp_module_client,
     mcp_server_env,
+    mcp_session_client,
+    mcp_session_test_server,
     mcp_test_server,
     snapshot,
     snapshot_dir,
 )
+from pytest_mcp.snapshot import flush_snapshot_writes
 
 logger = logging.getLogger(__name__)
 
+# Event loop policy replaced by --mcp-uvloop, restored when pytest exits
+_previous_loop_policy_key = pytest.StashKey[asyncio.AbstractEventLoopPolicy]()
+
+# Error from writing queued snapshot updates at the end of the session
+_snapshot_flush_error_key = pytest.StashKey[str]()
+
 # Export fixtures so pytest can discover them
 __all__ = [
+    "_mcp_shared_client_cache_reset",
     "mcp_client",
+    "mcp_module_client",
     "mcp_server_env",
+    "mcp_session_client",
+    "mcp_session_test_server",
     "mcp_test_server",
     "snapshot",
     "snapshot_dir",
@@ -50,15 +66,77 @@ def pytest_configure(config: pytest.Config) -> None:
     )
 
     # Add asyncio support if not already configured
-    if hasattr(config.option, 'asyncio_mode') and not config.option.asyncio_mode:
+    if hasattr(config.option, "asyncio_mode") and not config.option.asyncio_mode:
         config.option.asyncio_mode = "auto"
 
+    # Run async tests on uvloop when requested and available
+    if config.getoption("--mcp-uvloop", False):
+        try:
+            import uvloop
+        except ImportError:
+            logger.warning("--mcp-uvloop given but uvloop is not installed")
+        else:
+            # pytest-asyncio builds its loops from the current policy; the
+            # previous one is put back in pytest_unconfigure
+            config.stash[_previous_loop_policy_key] = asyncio.get_event_loop_policy()
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     logger.debug("pytest-mcp plugin configured")
 
 
-def pytest_collection_modifyitems(
-    config: pytest.Config, items: list[pytest.Item]
-) -> None:
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """
+    Pytest hook called before the test process exits.
+
+    Restores the event loop policy replaced by --mcp-uvloop.
+
+    Args:
+        config: Pytest configuration object
+    """
+    policy = config.stash.get(_previous_loop_policy_key, None)
+    if policy is not None:
+        asyncio.set_event_loop_policy(policy)
+        del config.stash[_previous_loop_policy_key]
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """
+    Pytest hook called after the whole test run finishes.
+
+    Writes snapshot updates queued during the run. Failed writes fail the
+    run and are listed in the terminal summary.
+
+    Args:
+        session: Pytest session object
+        exitstatus: Exit status of the test run
+    """
+    try:
+        flush_snapshot_writes()
+    except OSError as e:
+        if session.config.pluginmanager.get_plugin("terminalreporter") is None:
+            logger.error(str(e))
+        else:
+            session.config.stash[_snapshot_flush_error_key] = str(e)
+        if session.exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter) -> None:
+    """
+    Pytest hook to add a section to the terminal summary.
+
+    Reports snapshot updates that pytest_sessionfinish could not write.
+
+    Args:
+        terminalreporter: Pytest terminal reporter
+    """
+    error = terminalreporter.config.stash.get(_snapshot_flush_error_key, None)
+    if error is not None:
+        terminalreporter.write_sep("=", "pytest-mcp snapshot updates failed", red=True)
+        terminalreporter.write_line(error, red=True)
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
     """
     Pytest hook to modify collected test items.
 
@@ -73,10 +151,16 @@ def pytest_collection_modifyitems(
         if hasattr(item, "fixturenames"):
             fixture_names = getattr(item, "fixturenames", [])
 
-            if "mcp_client" in fixture_names or "mcp_test_server" in fixture_names:
+            if (
+                "mcp_client" in fixture_names
+                or "mcp_module_client" in fixture_names
+                or "mcp_session_client" in fixture_names
+                or "mcp_test_server" in fixture_names
+                or "mcp_session_test_server" in fixture_names
+            ):
                 item.add_marker(pytest.mark.mcp)
 
-            if "mcp_test_server" in fixture_names:
+            if "mcp_test_server" in fixture_names or "mcp_session_test_server" in fixture_names:
                 item.add_marker(pytest.mark.mcp_integration)
 
 
@@ -107,6 +191,19 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default=False,
         help="Update snapshot files instead of comparing",
     )
+    group.addoption(
+        "--mcp-snapshot-format",
+        action="store",
+        choices=["json", "msgpack"],
+        default="json",
+        help="Snapshot file format: json or msgpack (requires msgspec)",
+    )
+    group.addoption(
+        "--mcp-uvloop",
+        action="store_true",
+        default=False,
+        help="Run async tests on the uvloop event loop (requires uvloop)",
+    )
 
 
 def pytest_report_header(config: pytest.Config) -> list[str]:
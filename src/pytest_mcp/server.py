@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any, Sequence
 
@@ -27,10 +28,11 @@ class MCPTestServer:
 
     def __init__(
         self,
-        command: str,
+        command: str | None = None,
         args: Sequence[str] | None = None,
         env: dict[str, str] | None = None,
         *,
+        server_params: StdioServerParameters | None = None,
         timeout: float = 30.0,
     ) -> None:
         """
@@ -40,19 +42,47 @@ class MCPTestServer:
             command: Command to start the server
             args: Command arguments
             env: Environment variables
+            server_params: Prebuilt server parameters, used as-is instead of
+                command, args and env
             timeout: Timeout for server operations in seconds
+
+        Raises:
+            ValueError: If neither or both of command and server_params are given
         """
-        self.command = command
-        self.args = list(args) if args else []
-        self.env = env or {}
+        if server_params is None:
+            if command is None:
+                raise ValueError("MCPTestServer needs either command or server_params")
+            server_params = StdioServerParameters(
+                command=command,
+                args=list(args) if args else [],
+                env=env or {},
+            )
+        elif command is not None or args is not None or env is not None:
+            raise ValueError("Pass either command/args/env or server_params, not both")
+
+        self.command = server_params.command
+        self.args = server_params.args
+        self.env = server_params.env or {}
         self.timeout = timeout
 
         self._client: MockMCPClient | None = None
-        self._server_params = StdioServerParameters(
-            command=command,
-            args=self.args,
-            env=self.env,
-        )
+        self._server_params = server_params
+
+    @classmethod
+    def from_params(
+        cls, server_params: StdioServerParameters, *, timeout: float = 30.0
+    ) -> MCPTestServer:
+        """
+        Create a test server from existing server parameters.
+
+        Args:
+            server_params: MCP server parameters (command, args, env)
+            timeout: Timeout for server operations in seconds
+
+        Returns:
+            MCPTestServer instance using server_params as-is
+        """
+        return cls(server_params=server_params, timeout=timeout)
 
     async def __aenter__(self) -> MCPTestServer:
         """Enter async context and start server."""
@@ -128,12 +158,17 @@ class MCPTestServer:
         await self.stop()
         await self.start()
 
-    async def wait_for_ready(self, timeout: float | None = None) -> None:
+    async def wait_for_ready(self, timeout: float | None = None, *, ping: bool = False) -> None:
         """
         Wait for server to be ready to accept requests.
 
+        start() completes the MCP initialize handshake, so a running server
+        is ready without another round-trip. Pass ping=True to additionally
+        check that the server still responds.
+
         Args:
             timeout: Timeout in seconds (uses server timeout if not specified)
+            ping: If True, send an MCP ping and wait for the reply
 
         Raises:
             TimeoutError: If server doesn't become ready in time
@@ -141,13 +176,16 @@ class MCPTestServer:
         if timeout is None:
             timeout = self.timeout
 
-        # Try to list tools as a health check
-        try:
-            client = self.get_client()
-            await client.list_tools()
-            logger.debug("MCP test server is ready")
-        except Exception as e:
-            raise TimeoutError(f"Server did not become ready: {e}") from e
+        if not self.is_running:
+            raise TimeoutError("Server did not become ready: server is not started")
+
+        if ping:
+            try:
+                await asyncio.wait_for(self.get_client().ping(), timeout)
+            except Exception as e:
+                raise TimeoutError(f"Server did not become ready: {e}") from e
+
+        logger.debug("MCP test server is ready")
 
 
 class MCPTestServerFactory:
@@ -203,15 +241,36 @@ class MCPTestServerFactory:
         self._servers.append(server)
         return server
 
+    async def create_and_start_many(self, n: int) -> list[MCPTestServer]:
+        """
+        Create and concurrently start several test server instances.
+
+        Servers that did start are still tracked if another one fails, so
+        stop_all() cleans them up.
+
+        Args:
+            n: Number of servers to create
+
+        Returns:
+            List of started MCPTestServer instances
+
+        Raises:
+            RuntimeError: If any server fails to start
+        """
+        servers = [self.create() for _ in range(n)]
+        await asyncio.gather(*(server.start() for server in servers))
+        return servers
+
     async def stop_all(self) -> None:
         """
-        Stop all created servers.
+        Stop all created servers concurrently.
         """
-        for server in self._servers:
-            try:
-                await server.stop()
-            except Exception as e:
-                logger.warning(f"Error stopping server: {e}")
+        results = await asyncio.gather(
+            *(server.stop() for server in self._servers), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Error stopping server: {result}")
 
         self._servers.clear()
 
@@ -2,12 +2,310 @@
 
 from __future__ import annotations
 
+import asyncio
+import difflib
 import json
+import math
+import os
+import weakref
+from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import pytest
 
+from pytest_mcp.utils import json_loads
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - msgspec is optional
+    msgspec = None  # type: ignore[assignment, unused-ignore]
+
+# id(value) -> (weak reference to value, serialized bytes)
+_SNAPSHOT_BYTES_CACHE: dict[int, tuple[weakref.ref[Any], bytes]] = {}
+
+# Same bytes as json.dumps(indent=2, sort_keys=True, default=str) for the
+# values _orjson_compatible() accepts: datetimes and dataclasses go through
+# default=str instead of orjson's native encoding
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2
+    | orjson.OPT_SORT_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
+)
+
+# Snapshot format -> file suffix
+_SNAPSHOT_FORMATS = {"json": ".json", "msgpack": ".msgpack"}
+
+# Sorted keys keep msgpack snapshots canonical, like the JSON ones
+_MSGPACK_ENCODER = (
+    msgspec.msgpack.Encoder(enc_hook=str, order="sorted") if msgspec is not None else None
+)
+
+# Flags for snapshot file writes; O_BINARY only exists (and matters) on Windows
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Snapshot updates waiting for flush_snapshot_writes(), coalesced per path
+_WRITE_QUEUE: dict[Path, bytes] = {}
+
+# type -> dump method used by _normalize, or None for plain values
+_DUMPERS: dict[type, Callable[[Any], Any] | None] = {}
+
+# snapshot path -> (st_mtime_ns, st_size, parsed snapshot, raw JSON)
+_SNAPSHOT_CACHE: dict[str, tuple[int, int, Any, bytes]] = {}
+
+
+def _normalize(value: Any) -> Any:
+    """
+    Convert a value into the plain object that gets serialized to a snapshot.
+
+    Args:
+        value: Value to normalize
+
+    Returns:
+        The value, with pydantic models dumped to dicts
+    """
+    cls = type(value)
+    try:
+        dumper = _DUMPERS[cls]
+    except KeyError:
+        dumper = _DUMPERS[cls] = _resolve_dumper(cls)
+    if dumper is None:
+        return value
+    return dumper(value)
+
+
+def _resolve_dumper(cls: type) -> Callable[[Any], Any] | None:
+    """
+    Find the method that converts instances of a type to plain objects.
+
+    Args:
+        cls: Type of the value being normalized
+
+    Returns:
+        Unbound dump method, or None if values are used as they are
+    """
+    # Handle MCP-specific types
+    if hasattr(cls, "model_dump"):
+        # Pydantic model
+        return cls.model_dump  # type: ignore[no-any-return]
+    if hasattr(cls, "dict"):
+        # Older pydantic or dict-like
+        return cls.dict  # type: ignore[no-any-return]
+    if cls.__dictoffset__ or hasattr(cls, "__getattr__"):
+        # Instances may still gain the methods, e.g. mocks and proxies
+        return _dump_by_instance
+    return None
+
+
+def _dump_by_instance(value: Any) -> Any:
+    """Dump a value whose dump method can only be found on the instance."""
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    if hasattr(value, "dict"):
+        return value.dict()
+    return value
+
+
+def _encode(obj: Any) -> bytes:
+    """
+    Encode a normalized value as canonical snapshot JSON.
+
+    Args:
+        obj: Normalized value
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None and _orjson_compatible(obj):
+        try:
+            return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # e.g. integers wider than 64 bits, which only the stdlib handles
+            pass
+    return json.dumps(obj, indent=2, sort_keys=True, default=str).encode()
+
+
+def _orjson_compatible(obj: Any) -> bool:
+    """
+    Check that orjson encodes a value to the same bytes as the stdlib.
+
+    The stdlib escapes everything outside printable ASCII, writes enums as
+    str(member), NaN/Infinity literally, floats in repr() form (``1e+16``)
+    and sorts non-str keys before converting them. orjson writes raw UTF-8,
+    enum values, null, ``1e16`` and sorts converted keys, so any of these
+    sends the value to the stdlib. Enums that subclass str, int or float
+    encode to their value either way.
+
+    Args:
+        obj: Normalized value
+
+    Returns:
+        True if orjson's output is byte-identical to the stdlib's
+    """
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        cls = type(item)
+        if cls is str:
+            if not _is_plain_ascii(item):
+                return False
+        elif cls is dict:
+            for key in item:
+                if type(key) is not str or not _is_plain_ascii(key):
+                    return False
+            stack.extend(item.values())
+        elif cls is list or cls is tuple:
+            stack.extend(item)
+        elif cls is int or cls is bool or item is None:
+            continue
+        elif isinstance(item, float):
+            if not math.isfinite(item) or "e" in repr(item):
+                return False
+        elif isinstance(item, Enum):
+            if isinstance(item, str):
+                if not _is_plain_ascii(item):
+                    return False
+            elif not isinstance(item, int):
+                return False
+        elif isinstance(item, str):
+            if not _is_plain_ascii(item):
+                return False
+        elif isinstance(item, dict):
+            stack.append(dict(item))
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+        elif isinstance(item, int):
+            continue
+        elif not _is_plain_ascii(str(item)):
+            # Written through default=str
+            return False
+    return True
+
+
+def _is_plain_ascii(text: str) -> bool:
+    """Check that text is ASCII other than DEL, which only the stdlib escapes."""
+    return text.isascii() and "\x7f" not in text
+
+
+def _to_snapshot_bytes(value: Any) -> bytes:
+    """
+    Serialize a value to canonical snapshot JSON bytes.
+
+    Args:
+        value: Value to serialize; bytes are taken as already serialized
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if isinstance(value, bytes):
+        return value
+    return _encode(_normalize(value))
+
+
+def snapshot_bytes(value: Any) -> bytes:
+    """
+    Serialize a value to canonical snapshot bytes, memoized per object.
+
+    Passing the result to SnapshotHelper.assert_match skips re-serializing
+    an object that has already been snapshotted or compared. The bytes are
+    JSON, so they only fit helpers using the default json format. Only objects
+    that support weak references (such as pydantic models) are memoized;
+    the entry is dropped when the object is garbage collected.
+
+    Args:
+        value: Value to serialize
+
+    Returns:
+        UTF-8 encoded snapshot JSON
+
+    Example:
+        >>> result = await mcp_client.call_tool("get_user", {"id": 1})
+        >>> snapshot.assert_match(snapshot_bytes(result), "user_1")
+    """
+    key = id(value)
+    entry = _SNAPSHOT_BYTES_CACHE.get(key)
+    if entry is not None and entry[0]() is value:
+        return entry[1]
+
+    data = _to_snapshot_bytes(value)
+    try:
+        ref = weakref.ref(value, lambda _: _SNAPSHOT_BYTES_CACHE.pop(key, None))
+    except TypeError:
+        # dicts, lists and other builtins cannot be weakly referenced
+        return data
+
+    _SNAPSHOT_BYTES_CACHE[key] = (ref, data)
+    return data
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write a snapshot file so readers never see it half-written.
+
+    pytest-xdist workers share the snapshot directory, and parametrized tests
+    on different workers use the same snapshot file, so data is written to a
+    per-process temporary file and moved into place. The snapshot directory
+    is created on the first write into it.
+
+    Args:
+        path: Snapshot file path
+        data: File contents
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        try:
+            fd = os.open(tmp_path, _WRITE_FLAGS, 0o666)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp_path, _WRITE_FLAGS, 0o666)
+        try:
+            # Unbuffered; os.write may write less than asked for
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def flush_snapshot_writes() -> None:
+    """
+    Write all queued snapshot updates to disk.
+
+    Updates made with --mcp-update-snapshots (or update=True) are queued and
+    written in one pass; the plugin calls this at the end of the session.
+    A failed write doesn't stop the remaining ones.
+
+    Raises:
+        OSError: If any snapshot could not be written; the message lists
+            every failed path
+    """
+    failures: list[tuple[Path, OSError]] = []
+    for path, data in _WRITE_QUEUE.items():
+        try:
+            _write_atomic(path, data)
+        except OSError as e:
+            failures.append((path, e))
+        _SNAPSHOT_CACHE.pop(str(path), None)
+    _WRITE_QUEUE.clear()
+
+    if failures:
+        details = "\n".join(f"  {path}: {error}" for path, error in failures)
+        raise OSError(
+            f"Could not write {len(failures)} snapshot update(s):\n{details}"
+        ) from failures[0][1]
+
 
 class SnapshotHelper:
     """
@@ -16,26 +314,56 @@ class SnapshotHelper:
     Snapshots allow you to save tool outputs and compare them across test runs,
     making it easy to detect unexpected changes in behavior.
 
+    Snapshot updates (--mcp-update-snapshots or update=True) are queued and
+    written when the pytest session finishes. When using SnapshotHelper
+    outside the plugin, call flush_snapshot_writes() to write them.
+
     Example:
         >>> async def test_tool_output(mcp_client, snapshot):
         ...     result = await mcp_client.call_tool("get_user", {"id": 1})
         ...     snapshot.assert_match(result, "get_user_response")
     """
 
-    def __init__(self, request: pytest.FixtureRequest, snapshot_dir: Path) -> None:
+    def __init__(
+        self,
+        request: pytest.FixtureRequest,
+        snapshot_dir: Path,
+        *,
+        snapshot_format: str | None = None,
+    ) -> None:
         """
         Initialize snapshot helper.
 
         Args:
             request: Pytest fixture request
             snapshot_dir: Directory to store snapshots
+            snapshot_format: Snapshot file format, "json" (default) or "msgpack";
+                defaults to the --mcp-snapshot-format option
+
+        Raises:
+            ValueError: If the format is unknown
+            ImportError: If snapshot_format is "msgpack" and msgspec is not installed
         """
+        if snapshot_format is None:
+            snapshot_format = request.config.getoption("--mcp-snapshot-format", None) or "json"
+        if snapshot_format not in _SNAPSHOT_FORMATS:
+            raise ValueError(
+                f"Unknown snapshot format '{snapshot_format}', expected one of "
+                f"{', '.join(_SNAPSHOT_FORMATS)}"
+            )
+        if snapshot_format == "msgpack" and msgspec is None:
+            raise ImportError(
+                "msgpack snapshots require msgspec (pip install 'mcp-test-framework[fast]')"
+            )
+
         self.request = request
         self.snapshot_dir = snapshot_dir
+        self.snapshot_format = snapshot_format
+        self._suffix = _SNAPSHOT_FORMATS[snapshot_format]
         self.update_snapshots = request.config.getoption("--mcp-update-snapshots", False)
-
-        # Create snapshot directory if it doesn't exist
-        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        # Clean test name (remove parameters)
+        self._test_name = request.node.name.split("[", 1)[0]
+        self._path_cache: dict[str, Path] = {}
 
     def _get_snapshot_path(self, snapshot_name: str) -> Path:
         """
@@ -47,43 +375,102 @@ class SnapshotHelper:
         Returns:
             Path to snapshot file
         """
-        test_name = self.request.node.name
-        # Clean test name (remove parameters)
-        test_name = test_name.split("[")[0]
-
-        return self.snapshot_dir / f"{test_name}__{snapshot_name}.json"
+        path = self._path_cache.get(snapshot_name)
+        if path is None:
+            path = self.snapshot_dir / f"{self._test_name}__{snapshot_name}{self._suffix}"
+            self._path_cache[snapshot_name] = path
+        return path
 
     def _serialize(self, value: Any) -> str:
         """
         Serialize a value to JSON string.
 
+        Bytes are treated as already serialized, e.g. by snapshot_bytes().
+
         Args:
             value: Value to serialize
 
         Returns:
             JSON string
         """
-        # Handle MCP-specific types
-        if hasattr(value, "model_dump"):
-            # Pydantic model
-            value = value.model_dump()
-        elif hasattr(value, "dict"):
-            # Older pydantic or dict-like
-            value = value.dict()
+        return _to_snapshot_bytes(value).decode()
+
+    def _to_bytes(self, value: Any) -> bytes:
+        """
+        Serialize a value to canonical snapshot bytes in this helper's format.
 
-        return json.dumps(value, indent=2, sort_keys=True, default=str)
+        Args:
+            value: Value to serialize; bytes are taken as already serialized
+
+        Returns:
+            Snapshot file contents
+        """
+        if isinstance(value, bytes):
+            return value
+        return self._dumps(_normalize(value))
 
-    def _deserialize(self, json_str: str) -> Any:
+    def _dumps(self, obj: Any) -> bytes:
         """
-        Deserialize a JSON string.
+        Encode a normalized value in this helper's format.
 
         Args:
-            json_str: JSON string
+            obj: Normalized value
+
+        Returns:
+            Snapshot file contents
+        """
+        if _MSGPACK_ENCODER is not None and self.snapshot_format == "msgpack":
+            return bytes(_MSGPACK_ENCODER.encode(obj))
+        return _encode(obj)
+
+    def _deserialize(self, json_str: str | bytes) -> Any:
+        """
+        Deserialize snapshot contents.
+
+        Args:
+            json_str: JSON string, UTF-8 encoded JSON, or msgpack bytes for
+                msgpack snapshots
 
         Returns:
             Deserialized value
         """
-        return json.loads(json_str)
+        if self.snapshot_format == "msgpack":
+            return msgspec.msgpack.decode(json_str)
+        return json_loads(json_str)
+
+    def _load_snapshot(self, snapshot_path: Path) -> tuple[Any, bytes] | None:
+        """
+        Load a snapshot file, reusing the parsed value while the file is unchanged.
+
+        Parametrized tests often compare against the same snapshot; the file
+        is only re-read and re-parsed when its mtime or size changes.
+
+        Args:
+            snapshot_path: Path to snapshot file
+
+        Returns:
+            Tuple of (parsed value, raw JSON), or None if the file doesn't exist
+            and no update is queued for it
+        """
+        pending = _WRITE_QUEUE.get(snapshot_path)
+        if pending is not None:
+            return self._deserialize(pending), pending
+
+        key = str(snapshot_path)
+        try:
+            stat = os.stat(key)
+        except FileNotFoundError:
+            _SNAPSHOT_CACHE.pop(key, None)
+            return None
+
+        cached = _SNAPSHOT_CACHE.get(key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2], cached[3]
+
+        raw = snapshot_path.read_bytes()
+        parsed = self._deserialize(raw)
+        _SNAPSHOT_CACHE[key] = (stat.st_mtime_ns, stat.st_size, parsed, raw)
+        return parsed, raw
 
     def assert_match(
         self,
@@ -98,6 +485,11 @@ class SnapshotHelper:
         On first run or when update=True, saves the snapshot.
         On subsequent runs, compares against saved snapshot.
 
+        Pydantic models are dumped on every call. When the same result is
+        checked several times, pass result.model_dump() or
+        snapshot_bytes(result) to dump it once; plain dicts and bytes are
+        used as they are.
+
         Args:
             value: Value to snapshot
             snapshot_name: Name for this snapshot
@@ -112,29 +504,84 @@ class SnapshotHelper:
         snapshot_path = self._get_snapshot_path(snapshot_name)
         should_update = update if update is not None else self.update_snapshots
 
-        # Serialize the value
-        actual_json = self._serialize(value)
+        if should_update:
+            # Queue the update; it is written when the session finishes
+            _WRITE_QUEUE[snapshot_path] = self._to_bytes(value)
+            pytest.skip(f"Updated snapshot: {snapshot_name}")
 
-        if should_update or not snapshot_path.exists():
-            # Save/update snapshot
-            snapshot_path.write_text(actual_json)
-            if should_update:
-                pytest.skip(f"Updated snapshot: {snapshot_name}")
+        loaded = self._load_snapshot(snapshot_path)
+        if loaded is None:
+            # Save new snapshot
+            _write_atomic(snapshot_path, self._to_bytes(value))
+            _SNAPSHOT_CACHE.pop(str(snapshot_path), None)
             return
 
-        # Load and compare snapshot
-        expected_json = snapshot_path.read_text()
-        expected = self._deserialize(expected_json)
-        actual = self._deserialize(actual_json)
+        # Compare against the (possibly cached) snapshot
+        expected, expected_raw = loaded
+        if isinstance(value, bytes):
+            actual_raw = value
+        else:
+            normalized = _normalize(value)
+            if normalized == expected:
+                # Plain JSON-typed values match without a serialize/parse round trip
+                return
+            actual_raw = self._dumps(normalized)
+
+        # Encoding is canonical (sorted keys, fixed indent), so identical bytes
+        # mean identical values
+        if actual_raw == expected_raw:
+            return
+
+        # Values such as AnyUrl or tuples only compare equal after a JSON
+        # round trip, and files written by other encoders may differ in
+        # formatting only, so confirm a mismatch on the parsed form
+        actual = self._deserialize(actual_raw)
 
         if actual != expected:
+            # Diff the canonical JSON of both sides, so binary snapshots and
+            # files written by other encoders still diff line by line
+            diff = "\n".join(
+                difflib.unified_diff(
+                    _encode(expected).decode().splitlines(),
+                    _encode(actual).decode().splitlines(),
+                    fromfile="snapshot",
+                    tofile="actual",
+                    lineterm="",
+                )
+            )
             raise AssertionError(
                 f"Snapshot mismatch for '{snapshot_name}'.\n"
-                f"Expected:\n{expected_json}\n\n"
-                f"Actual:\n{actual_json}\n\n"
+                f"{diff}\n\n"
                 f"To update snapshots, run with --mcp-update-snapshots"
             )
 
+    async def assert_match_async(
+        self,
+        value: Any,
+        snapshot_name: str,
+        *,
+        update: bool | None = None,
+    ) -> None:
+        """
+        Assert that a value matches the saved snapshot, encoding it off the event loop.
+
+        Behaves like assert_match, but serializes the value in a worker thread
+        so large outputs don't block other tasks on the loop.
+
+        Args:
+            value: Value to snapshot
+            snapshot_name: Name for this snapshot
+            update: Override global update_snapshots setting
+
+        Raises:
+            AssertionError: If value doesn't match snapshot
+
+        Example:
+            >>> await snapshot.assert_match_async(result, "large_report")
+        """
+        data = await asyncio.to_thread(self._to_bytes, value)
+        self.assert_match(data, snapshot_name, update=update)
+
     def assert_match_json(
         self,
         value: dict[str, Any] | list[Any],
@@ -181,13 +628,24 @@ class SnapshotHelper:
 
         should_update = update if update is not None else self.update_snapshots
 
-        if should_update or not snapshot_path.exists():
-            snapshot_path.write_text(text)
-            if should_update:
-                pytest.skip(f"Updated snapshot: {snapshot_name}")
+        if should_update:
+            # Queue the update; it is written when the session finishes
+            _WRITE_QUEUE[snapshot_path] = text.encode()
+            pytest.skip(f"Updated snapshot: {snapshot_name}")
+
+        expected_raw = _WRITE_QUEUE.get(snapshot_path)
+        if expected_raw is None:
+            try:
+                expected_raw = snapshot_path.read_bytes()
+            except FileNotFoundError:
+                _write_atomic(snapshot_path, text.encode())
+                return
+
+        if text.encode() == expected_raw:
             return
 
-        expected_text = snapshot_path.read_text()
+        # Snapshots written in text mode on Windows may carry CRLF line endings
+        expected_text = expected_raw.decode().replace("\r\n", "\n")
         if text != expected_text:
             raise AssertionError(
                 f"Text snapshot mismatch for '{snapshot_name}'.\n"
@@ -206,12 +664,12 @@ class SnapshotHelper:
         Returns:
             Snapshot value if exists, None otherwise
         """
-        snapshot_path = self._get_snapshot_path(snapshot_name)
-        if not snapshot_path.exists():
+        loaded = self._load_snapshot(self._get_snapshot_path(snapshot_name))
+        if loaded is None:
             return None
 
-        json_str = snapshot_path.read_text()
-        return self._deserialize(json_str)
+        # Parse a fresh copy so callers can't mutate the cached value
+        return self._deserialize(loaded[1])
 
     def delete_snapshot(self, snapshot_name: str) -> None:
         """
@@ -221,8 +679,9 @@ class SnapshotHelper:
             snapshot_name: Name of the snapshot to delete
         """
         snapshot_path = self._get_snapshot_path(snapshot_name)
-        if snapshot_path.exists():
-            snapshot_path.unlink()
+        _WRITE_QUEUE.pop(snapshot_path, None)
+        snapshot_path.unlink(missing_ok=True)
+        _SNAPSHOT_CACHE.pop(str(snapshot_path), None)
 
     def list_snapshots(self) -> list[str]:
         """
@@ -231,13 +690,29 @@ class SnapshotHelper:
         Returns:
             List of snapshot names
         """
-        test_name = self.request.node.name.split("[")[0]
-        pattern = f"{test_name}__*.json"
+        prefix = f"{self._test_name}__"
+        suffix = self._suffix
 
-        snapshots = []
-        for path in self.snapshot_dir.glob(pattern):
-            # Extract snapshot name from filename
-            name = path.stem.replace(f"{test_name}__", "")
-            snapshots.append(name)
+        def snapshot_name(file_name: str) -> str | None:
+            if file_name.startswith(prefix) and file_name.endswith(suffix):
+                return file_name[len(prefix) : -len(suffix)]
+            return None
 
-        return sorted(snapshots)
+        names = set()
+        try:
+            with os.scandir(self.snapshot_dir) as entries:
+                for entry in entries:
+                    name = snapshot_name(entry.name)
+                    if name is not None:
+                        names.add(name)
+        except FileNotFoundError:
+            pass
+
+        # Include updates that are queued but not yet written
+        for path in _WRITE_QUEUE:
+            if path.parent == self.snapshot_dir:
+                name = snapshot_name(path.name)
+                if name is not None:
+                    names.add(name)
+
+        return sorted(names)
@@ -3,11 +3,57 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, TypeVar, Callable
+import json
+import re
+from contextlib import AbstractContextManager
 from functools import wraps
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, TypeVar
+
+import anyio
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+try:
+    from jsonschema import Draft202012Validator
+    from jsonschema.exceptions import SchemaError, UnknownType
+except ImportError:  # pragma: no cover - jsonschema is optional
+    Draft202012Validator = None  # type: ignore[assignment, misc, unused-ignore]
+
+if TYPE_CHECKING:
+    from mcp.types import Tool
 
 T = TypeVar("T")
 
+# Longest argument repr shown by format_tool_signature
+_MAX_ARG_REPR = 80
+
+# JSON schema type name -> Python types accepted for it
+_TYPE_CHECK: dict[str, type | tuple[type, ...]] = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+# id(schema) -> (schema, validator or None if jsonschema rejects the schema);
+# the schema is kept so a recycled id can't pick up another schema's validator
+_VALIDATOR_CACHE: dict[int, tuple[dict[str, Any], Any]] = {}
+_VALIDATOR_CACHE_SIZE = 256
+
+# Common prefixes stripped by extract_error_message, each at most once and in
+# this order
+_ERROR_PREFIX_RE = re.compile(r"^(?:Error: )?(?:Exception: )?(?:RuntimeError: )?")
+
+# Digit runs long enough to be an integer outside orjson's 64-bit range, which
+# it would parse as a lossy float
+_WIDE_INT_RE = re.compile(r"\d{20}")
+_WIDE_INT_BYTES_RE = re.compile(rb"\d{20}")
+
 
 def is_async_test(func: Callable[..., Any]) -> bool:
     """
@@ -31,7 +77,8 @@ def format_tool_signature(tool_name: str, arguments: dict[str, Any] | None) -> s
         arguments: Tool arguments
 
     Returns:
-        Formatted signature string
+        Formatted signature string; argument reprs longer than 80 characters
+        are truncated
 
     Example:
         >>> format_tool_signature("add", {"a": 1, "b": 2})
@@ -40,10 +87,28 @@ def format_tool_signature(tool_name: str, arguments: dict[str, Any] | None) -> s
     if not arguments:
         return f"{tool_name}()"
 
-    args_str = ", ".join(f"{k}={v!r}" for k, v in arguments.items())
+    args_str = ", ".join(
+        [f"{k}={truncate_string(repr(v), _MAX_ARG_REPR)}" for k, v in arguments.items()]
+    )
     return f"{tool_name}({args_str})"
 
 
+def index_tools(tools: list[Tool]) -> dict[str, Tool]:
+    """
+    Index tools by name.
+
+    Args:
+        tools: Tools as returned by list_tools()
+
+    Returns:
+        Mapping of tool name to tool, keeping the first tool for duplicate names
+    """
+    index: dict[str, Tool] = {}
+    for tool in tools:
+        index.setdefault(tool.name, tool)
+    return index
+
+
 def truncate_string(s: str, max_length: int = 100) -> str:
     """
     Truncate a string to maximum length.
@@ -73,11 +138,19 @@ def deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]
     """
     result = base.copy()
 
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
+    # Worklist of (destination copy, override) pairs; nested dicts are copied
+    # only where both sides have a dict to merge
+    stack = [(result, override)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                child = current.copy()
+                dst[key] = child
+                stack.append((child, value))
+            else:
+                dst[key] = value
 
     return result
 
@@ -92,15 +165,36 @@ def extract_error_message(exception: Exception) -> str:
     Returns:
         Clean error message
     """
-    message = str(exception)
+    return _ERROR_PREFIX_RE.sub("", str(exception), count=1).strip()
 
-    # Remove common prefixes
-    prefixes = ["Error: ", "Exception: ", "RuntimeError: "]
-    for prefix in prefixes:
-        if message.startswith(prefix):
-            message = message[len(prefix) :]
 
-    return message.strip()
+def json_loads(data: str | bytes) -> Any:
+    """
+    Parse JSON to the same value as json.loads, using orjson when it is safe.
+
+    orjson turns integers wider than 64 bits into floats and rejects NaN,
+    Infinity and lone surrogates, so such documents go through the stdlib.
+
+    Args:
+        data: JSON text or UTF-8 encoded JSON
+
+    Returns:
+        Parsed value
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None:
+        if isinstance(data, bytes):
+            has_wide_int = _WIDE_INT_BYTES_RE.search(data) is not None
+        else:
+            has_wide_int = _WIDE_INT_RE.search(data) is not None
+        if not has_wide_int:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
 
 
 def safe_repr(obj: Any, max_length: int = 200) -> str:
@@ -132,6 +226,12 @@ class TimeoutContext:
     """
     Context manager for operation timeouts.
 
+    Cancels the enclosed block once the timeout elapses and raises
+    TimeoutError with error_message.
+
+    Raises:
+        TimeoutError: If the block does not finish in time
+
     Example:
         >>> async with TimeoutContext(5.0):
         ...     await some_long_operation()
@@ -147,21 +247,29 @@ class TimeoutContext:
         """
         self.timeout = timeout
         self.error_message = error_message or f"Operation timed out after {timeout}s"
+        self._deadline: AbstractContextManager[Any] | None = None
 
     async def __aenter__(self) -> None:
-        """Enter context."""
-        pass
+        """Enter context and start the timeout."""
+        self._deadline = anyio.fail_after(self.timeout)
+        self._deadline.__enter__()
 
-    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Exit context."""
-        pass
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> bool | None:
+        """Exit context, raising TimeoutError if the block timed out."""
+        deadline, self._deadline = self._deadline, None
+        if deadline is None:
+            return None
+        try:
+            return deadline.__exit__(exc_type, exc_val, exc_tb)
+        except TimeoutError as e:
+            raise TimeoutError(self.error_message) from e
 
 
 def retry_on_failure(
     max_attempts: int = 3,
     delay: float = 1.0,
     backoff: float = 2.0,
-) -> Callable[[Callable[..., T]], Callable[..., T]]:
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
     """
     Decorator to retry async functions on failure.
 
@@ -180,35 +288,75 @@ def retry_on_failure(
         ...     pass
     """
 
-    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+    # Sleep before each retry; the last attempt's failure is raised directly
+    delays = [delay * backoff**i for i in range(max_attempts - 1)]
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> T:
-            current_delay = delay
-            last_exception = None
-
-            for attempt in range(max_attempts):
+            for retry_delay in delays:
                 try:
                     return await func(*args, **kwargs)
-                except Exception as e:
-                    last_exception = e
-                    if attempt < max_attempts - 1:
-                        await asyncio.sleep(current_delay)
-                        current_delay *= backoff
+                except Exception:
+                    pass
+                await asyncio.sleep(retry_delay)
 
-            # All attempts failed
-            raise last_exception  # type: ignore
+            return await func(*args, **kwargs)
 
-        return wrapper  # type: ignore
+        return wrapper
 
     return decorator
 
 
-def validate_tool_arguments(
-    arguments: dict[str, Any], schema: dict[str, Any]
-) -> list[str]:
+def _get_validator(schema: dict[str, Any]) -> Any:
+    """Return a compiled validator for a schema, reusing it across calls."""
+    cached = _VALIDATOR_CACHE.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+
+    if len(_VALIDATOR_CACHE) >= _VALIDATOR_CACHE_SIZE:
+        _VALIDATOR_CACHE.clear()
+    try:
+        Draft202012Validator.check_schema(schema)
+        validator = Draft202012Validator(schema)
+    except SchemaError:
+        # Tool schemas come from third-party servers; fall back to the
+        # built-in checks rather than failing on a malformed one
+        validator = None
+    _VALIDATOR_CACHE[id(schema)] = (schema, validator)
+    return validator
+
+
+def _is_builtin_error(error: Any, schema: dict[str, Any]) -> bool:
+    """Check whether a jsonschema error duplicates one of the built-in checks."""
+    path = list(error.relative_schema_path)
+    if path == ["required"]:
+        return True
+    if len(path) == 3 and path[0] == "properties" and path[2] == "type":
+        return _expected_type(schema, path[1]) is not None
+    return False
+
+
+def _expected_type(schema: dict[str, Any], field: str) -> type | tuple[type, ...] | None:
+    """Return the Python types the built-in check accepts for a property, if any."""
+    expected_type = schema.get("properties", {}).get(field, {}).get("type")
+    if not isinstance(expected_type, str):
+        return None
+    return _TYPE_CHECK.get(expected_type)
+
+
+def validate_tool_arguments(arguments: dict[str, Any], schema: dict[str, Any]) -> list[str]:
     """
     Validate tool arguments against a JSON schema.
 
+    Required fields and top-level property types are always checked, with
+    the messages "Missing required argument: <field>" and "Argument '<field>'
+    has wrong type: expected <type>, got <python type>". When jsonschema is
+    installed the rest of the schema (nested properties, enums, patterns, ...)
+    is validated too, and those errors use jsonschema's own messages. Schemas
+    jsonschema cannot handle, e.g. with an unknown "type", only get the
+    built-in checks.
+
     Args:
         arguments: Tool arguments to validate
         schema: JSON schema to validate against
@@ -225,24 +373,32 @@ def validate_tool_arguments(
             errors.append(f"Missing required argument: {field}")
 
     # Check field types
-    properties = schema.get("properties", {})
     for field, value in arguments.items():
-        if field in properties:
-            expected_type = properties[field].get("type")
-            if expected_type:
-                actual_type = type(value).__name__
-                type_map = {
-                    "str": "string",
-                    "int": "integer",
-                    "float": "number",
-                    "bool": "boolean",
-                    "list": "array",
-                    "dict": "object",
-                }
-                if type_map.get(actual_type) != expected_type:
-                    errors.append(
-                        f"Argument '{field}' has wrong type: "
-                        f"expected {expected_type}, got {actual_type}"
-                    )
-
-    return errors
+        expected_cls = _expected_type(schema, field)
+        if expected_cls is None:
+            continue
+        expected_type = schema["properties"][field]["type"]
+        # bool is an int subclass but not a JSON integer or number
+        if not isinstance(value, expected_cls) or (
+            isinstance(value, bool) and expected_type != "boolean"
+        ):
+            errors.append(
+                f"Argument '{field}' has wrong type: "
+                f"expected {expected_type}, got {type(value).__name__}"
+            )
+
+    if Draft202012Validator is None:
+        return errors
+
+    validator = _get_validator(schema)
+    if validator is None:
+        return errors
+    try:
+        schema_errors = [
+            error.message
+            for error in validator.iter_errors(arguments)
+            if not _is_builtin_error(error, schema)
+        ]
+    except UnknownType:
+        return errors
+    return errors + schema_errors
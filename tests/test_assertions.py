@@ -6,10 +6,16 @@ import pytest
 from mcp.types import CallToolResult, TextContent, Tool
 
 from pytest_mcp.assertions import (
+    _format_names,
+    _multi_substring_match,
+    assert_error_message_matches,
+    assert_resource_content_matches,
+    assert_resource_exists,
     assert_tool_count,
     assert_tool_exists,
     assert_tool_output_matches,
     assert_tool_schema_valid,
+    assert_tools,
     assert_tools_have_unique_names,
 )
 from pytest_mcp.client import MockMCPClient
@@ -90,6 +96,36 @@ class TestAssertions:
         # Should parse JSON and match
         await assert_tool_output_matches(result, {"value": 42})
 
+    @pytest.mark.asyncio
+    async def test_assert_tool_output_matches_json_shape_mismatch(self) -> None:
+        """Test that a JSON array never matches an expected dict."""
+        result = CallToolResult(
+            content=[TextContent(type="text", text=' [{"value": 42}]')],
+        )
+
+        with pytest.raises(AssertionError, match="Tool output mismatch"):
+            await assert_tool_output_matches(result, {"value": 42})
+        await assert_tool_output_matches(result, [{"value": 42}])
+
+    async def test_assert_tool_output_matches_json_wide_int(self) -> None:
+        """Test that integers wider than 64 bits are compared exactly."""
+        result = CallToolResult(
+            content=[TextContent(type="text", text='{"value": 123456789012345678901234567890}')],
+        )
+
+        await assert_tool_output_matches(result, {"value": 123456789012345678901234567890})
+        with pytest.raises(AssertionError, match="Tool output mismatch"):
+            await assert_tool_output_matches(result, {"value": 123456789012345678901234567891})
+
+    async def test_assert_tool_output_matches_json_nan(self) -> None:
+        """Test that JSON the stdlib accepts but orjson rejects is still parsed."""
+        result = CallToolResult(
+            content=[TextContent(type="text", text='{"value": NaN, "ok": Infinity}')],
+        )
+
+        with pytest.raises(AssertionError, match="'ok': inf"):
+            await assert_tool_output_matches(result, {"value": 1, "ok": 1})
+
     @pytest.mark.asyncio
     async def test_assert_tool_output_matches_failure(self) -> None:
         """Test assert_tool_output_matches with mismatch."""
@@ -168,3 +204,105 @@ class TestAssertions:
 
         with pytest.raises(AssertionError, match="Duplicate tool names found"):
             await assert_tools_have_unique_names(client)
+
+    @pytest.mark.asyncio
+    async def test_assert_tools_success(self, mocker) -> None:
+        """Test assert_tools runs every check against one listing."""
+        client = mocker.Mock(spec=MockMCPClient)
+        tools = [
+            Tool(name="tool1", description="Test tool 1", inputSchema={"type": "object"}),
+            Tool(name="tool2", description="Test tool 2", inputSchema={"type": "object"}),
+        ]
+        client.list_tools = mocker.AsyncMock(return_value=tools)
+
+        tools_by_name = await assert_tools(
+            client, exist=["tool1", "tool2"], count=2, unique=True, schemas_valid=True
+        )
+        assert tools_by_name["tool1"].name == "tool1"
+        client.list_tools.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_assert_tools_failure(self, mocker) -> None:
+        """Test assert_tools with a missing tool."""
+        client = mocker.Mock(spec=MockMCPClient)
+        tools = [
+            Tool(name="tool1", description="Test tool 1", inputSchema={"type": "object"}),
+        ]
+        client.list_tools = mocker.AsyncMock(return_value=tools)
+
+        with pytest.raises(AssertionError, match="Tool 'tool2' not found"):
+            await assert_tools(client, exist=["tool2"])
+
+    def test_multi_substring_match(self) -> None:
+        """Test searching for several substrings at once."""
+        assert _multi_substring_match("Cannot divide by zero", ["zero", "nan"]) == "zero"
+        assert _multi_substring_match("a.b", ["x", "."]) == "."
+        assert _multi_substring_match("nothing", ["x", "y"]) is None
+        assert _multi_substring_match("nothing", []) is None
+
+    @pytest.mark.asyncio
+    async def test_assert_error_message_matches(self, mocker) -> None:
+        """Test assert_error_message_matches accepts any listed substring."""
+        client = mocker.Mock(spec=MockMCPClient)
+        client.call_tool = mocker.AsyncMock(side_effect=ValueError("Cannot divide by zero"))
+
+        await assert_error_message_matches(
+            client, "divide", {"a": 1, "b": 0}, needles=["division by zero", "divide by zero"]
+        )
+        with pytest.raises(AssertionError, match="Expected any of"):
+            await assert_error_message_matches(client, "divide", needles=["overflow"])
+
+    def test_format_names_truncates(self) -> None:
+        """Test that long name lists are capped in error messages."""
+        assert _format_names(["a", "b"]) == "a, b"
+        assert _format_names([f"t{i}" for i in range(25)], limit=3) == "t0, t1, t2, ... (22 more)"
+
+    @pytest.mark.asyncio
+    async def test_assert_resource_content_matches_truncates_large_content(self, mocker) -> None:
+        """Test that mismatch messages preview large resources instead of dumping them."""
+        from mcp.types import ReadResourceResult, TextResourceContents
+
+        client = mocker.Mock(spec=MockMCPClient)
+        client.read_resource = mocker.AsyncMock(
+            return_value=ReadResourceResult(
+                contents=[TextResourceContents(uri="data://big", text="x" * 10_000)]
+            )
+        )
+
+        await assert_resource_content_matches(client, "data://big", "x" * 10_000)
+        with pytest.raises(AssertionError, match=r"Actual \(10000 chars\)") as exc_info:
+            await assert_resource_content_matches(client, "data://big", "y")
+        assert len(str(exc_info.value)) < 2_000
+
+    async def test_assert_resource_exists_uses_uri_index(self, mocker) -> None:
+        """Test that resource lookups reuse the client's cached URI index."""
+        from mcp.types import Resource
+
+        client = MockMCPClient(command="python", cache_listings=True)
+        client._session = mocker.AsyncMock()
+        client._session.list_resources.return_value.resources = [
+            Resource(uri="data://a", name="a"),
+            Resource(uri="data://b", name="b"),
+        ]
+
+        await assert_resource_exists(client, "data://a")
+        await assert_resource_exists(client, "data://b")
+        with pytest.raises(AssertionError, match=r"Available resources: data://a, data://b"):
+            await assert_resource_exists(client, "data://missing")
+
+        assert client._session.list_resources.await_count == 1
+        assert client._resources_by_uri is not None
+
+    async def test_assert_resource_content_matches_rejects_blob(self, mocker) -> None:
+        """Test that binary resources fail instead of comparing as empty text."""
+        from mcp.types import BlobResourceContents, ReadResourceResult
+
+        client = mocker.Mock(spec=MockMCPClient)
+        client.read_resource = mocker.AsyncMock(
+            return_value=ReadResourceResult(
+                contents=[BlobResourceContents(uri="data://img", blob="AAAA", mimeType="image/png")]
+            )
+        )
+
+        with pytest.raises(AssertionError, match=r"binary content \(image/png\)"):
+            await assert_resource_content_matches(client, "data://img", "")
@@ -63,6 +63,107 @@ class TestMockMCPClient:
             # Expected to fail with example params
             pass
 
+    @pytest.mark.asyncio
+    async def test_cache_listings(self, mocker) -> None:
+        """Test that listings are cached until a tool call invalidates them."""
+        client = MockMCPClient(command="python", cache_listings=True)
+        client._session = mocker.AsyncMock()
+        client._session.list_tools.return_value.tools = []
+
+        await client.list_tools()
+        await client.list_tools()
+        assert client._session.list_tools.await_count == 1
+
+        await client.call_tool("noop")
+        await client.list_tools()
+        assert client._session.list_tools.await_count == 2
+
+    async def test_cached_listings_are_copies(self, mocker) -> None:
+        """Test that mutating a returned listing leaves the cache intact."""
+        from mcp.types import Resource, Tool
+
+        client = MockMCPClient(command="python", cache_listings=True)
+        client._session = mocker.AsyncMock()
+        client._session.list_tools.return_value.tools = [
+            Tool(name="echo", inputSchema={"type": "object"})
+        ]
+        client._session.list_resources.return_value.resources = [Resource(uri="data://a", name="a")]
+
+        (await client.list_tools()).clear()
+        (await client.list_resources()).clear()
+        (await client.list_tools()).clear()
+
+        assert [tool.name for tool in await client.list_tools()] == ["echo"]
+        assert len(await client.list_resources()) == 1
+        assert client._session.list_tools.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_listings_not_cached_by_default(self, mocker) -> None:
+        """Test that every list_tools() call reaches the server by default."""
+        client = MockMCPClient(command="python")
+        client._session = mocker.AsyncMock()
+        client._session.list_tools.return_value.tools = []
+
+        await client.list_tools()
+        await client.list_tools()
+        assert client._session.list_tools.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_tool_uses_cached_index(self, mocker) -> None:
+        """Test that repeated get_tool() lookups share one listing."""
+        from mcp.types import Tool
+
+        client = MockMCPClient(command="python", cache_listings=True)
+        client._session = mocker.AsyncMock()
+        client._session.list_tools.return_value.tools = [
+            Tool(name="add", inputSchema={"type": "object"}),
+        ]
+
+        assert (await client.get_tool("add")).name == "add"
+        assert await client.get_tool("missing") is None
+        assert client._session.list_tools.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_resource_by_uri(self, mocker) -> None:
+        """Test get_resource() with exact and normalized URI strings."""
+        from mcp.types import Resource
+
+        client = MockMCPClient(command="python")
+        client._session = mocker.AsyncMock()
+        client._session.list_resources.return_value.resources = [
+            Resource(uri="users://all", name="Users"),
+            Resource(uri="https://example.com", name="Site"),
+        ]
+
+        assert (await client.get_resource("users://all")).name == "Users"
+        assert (await client.get_resource("https://example.com")).name == "Site"
+        assert await client.get_resource("users://none") is None
+
+    @pytest.mark.asyncio
+    async def test_in_process_server(self) -> None:
+        """Test connecting to a server object over memory streams."""
+        from mcp.server.lowlevel import Server
+        from mcp.types import TextContent, Tool
+
+        app: Server[object] = Server("in-process")
+
+        @app.list_tools()
+        async def list_tools() -> list[Tool]:
+            return [Tool(name="echo", inputSchema={"type": "object"})]
+
+        @app.call_tool()
+        async def call_tool(name: str, arguments: dict[str, str]) -> list[TextContent]:
+            return [TextContent(type="text", text=arguments["text"])]
+
+        async with MockMCPClient(server_object=app) as client:
+            tools = await client.list_tools()
+            assert [tool.name for tool in tools] == ["echo"]
+
+            result = await client.call_tool("echo", {"text": "hi"})
+            assert result.content[0].text == "hi"
+
+            await client.ping()
+
 
 # Integration tests would go here if we had a real test server
 # For now, these are structural tests
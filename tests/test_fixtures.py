@@ -7,7 +7,7 @@ from pathlib import Path
 import pytest
 from mcp import StdioServerParameters
 
-from pytest_mcp.fixtures import mcp_server_env, snapshot_dir
+from pytest_mcp.fixtures import _coerce_server_params, mcp_server_env, snapshot_dir
 
 
 class TestFixtures:
@@ -29,6 +29,27 @@ class TestFixtures:
         # Default should be empty
         assert len(result) == 0
 
+    @pytest.mark.parametrize(
+        "mcp_server",
+        [
+            StdioServerParameters(command="python", args=["server.py"], env={"A": "1"}),
+            {"command": "python", "args": ["server.py"], "env": {"A": "1"}},
+            ("python", ["server.py"], {"A": "1"}),
+        ],
+    )
+    def test_coerce_server_params(self, mcp_server: object) -> None:
+        """Test that every mcp_server format is layered over the base env."""
+        params = _coerce_server_params(mcp_server, {"A": "0", "B": "2"})
+
+        assert params.command == "python"
+        assert params.args == ["server.py"]
+        assert params.env == {"A": "1", "B": "2"}
+
+    def test_coerce_server_params_rejects_unknown_type(self) -> None:
+        """Test that unsupported mcp_server values raise TypeError."""
+        with pytest.raises(TypeError, match="mcp_server fixture must return"):
+            _coerce_server_params("python server.py")
+
 
 # Note: Testing mcp_client fixture requires a real server
 # Those tests would go in integration tests
@@ -0,0 +1,74 @@
+"""Tests for pytest-mcp plugin hooks."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import types
+
+import pytest
+
+from pytest_mcp.plugin import pytest_configure, pytest_unconfigure
+
+pytest_plugins = ["pytester"]
+
+
+class TestSessionFinish:
+    """Test suite for pytest_sessionfinish."""
+
+    def test_reports_failed_snapshot_writes(self, pytester: pytest.Pytester) -> None:
+        """Test that a failed flush is summarized and fails the run without a traceback."""
+        pytester.makepyfile("""
+            from pytest_mcp.snapshot import SnapshotHelper
+
+            def test_update(request, tmp_path):
+                blocker = tmp_path / "not_a_dir"
+                blocker.write_text("")
+                helper = SnapshotHelper(request, blocker / "__snapshots__")
+                helper.assert_match({"test": 1}, "flush", update=True)
+            """)
+
+        result = pytester.runpytest("-p", "no:asyncio")
+
+        assert result.ret == pytest.ExitCode.TESTS_FAILED
+        result.stdout.fnmatch_lines(
+            ["*pytest-mcp snapshot updates failed*", "Could not write 1 snapshot update(s):"]
+        )
+        result.stdout.no_fnmatch_line("*Traceback*")
+
+    def test_keeps_exit_status_when_flush_succeeds(self, pytester: pytest.Pytester) -> None:
+        """Test that written snapshot updates leave the run's exit status alone."""
+        pytester.makepyfile("""
+            def test_update(snapshot):
+                snapshot.assert_match({"test": 1}, "flush", update=True)
+            """)
+
+        result = pytester.runpytest("-p", "no:asyncio")
+
+        assert result.ret == pytest.ExitCode.OK
+        assert list(pytester.path.glob("__snapshots__/*.json"))
+
+
+class TestUvloopOption:
+    """Test suite for the --mcp-uvloop option."""
+
+    def test_restores_event_loop_policy(
+        self, pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the uvloop policy only lasts until pytest unconfigures."""
+
+        class FakeUvloopPolicy(asyncio.DefaultEventLoopPolicy):
+            pass
+
+        fake_uvloop = types.SimpleNamespace(EventLoopPolicy=FakeUvloopPolicy)
+        monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+        before = asyncio.get_event_loop_policy()
+        config = pytester.parseconfig("--mcp-uvloop")
+
+        pytest_configure(config)
+        try:
+            assert isinstance(asyncio.get_event_loop_policy(), FakeUvloopPolicy)
+        finally:
+            pytest_unconfigure(config)
+
+        assert asyncio.get_event_loop_policy() is before
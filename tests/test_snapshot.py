@@ -2,23 +2,48 @@
 
 from __future__ import annotations
 
+import datetime
 import json
+import math
+import os
+import uuid
+from dataclasses import dataclass
+from enum import Enum, IntEnum
 from pathlib import Path
 
 import pytest
 
-from pytest_mcp.snapshot import SnapshotHelper
+from pytest_mcp import snapshot as snapshot_module
+from pytest_mcp.snapshot import SnapshotHelper, flush_snapshot_writes, snapshot_bytes
+
+
+def _snapshot_files(directory: Path, suffix: str = ".json") -> list[str]:
+    """List snapshot file names in a directory without building Path objects."""
+    with os.scandir(directory) as entries:
+        return [entry.name for entry in entries if entry.name.endswith(suffix)]
+
+
+@pytest.fixture(scope="module")
+def snapshot_base_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one base directory for the module's snapshot directories."""
+    return tmp_path_factory.mktemp("snaps")
+
+
+@pytest.fixture(scope="module")
+def serialize_helper(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> SnapshotHelper:
+    """Create one SnapshotHelper shared by tests that never touch the disk."""
+    return SnapshotHelper(request, tmp_path_factory.mktemp("__snapshots__"))
 
 
 class TestSnapshotHelper:
     """Test suite for SnapshotHelper."""
 
     @pytest.fixture
-    def temp_snapshot_dir(self, tmp_path: Path) -> Path:
-        """Create a temporary snapshot directory."""
-        snapshot_dir = tmp_path / "__snapshots__"
-        snapshot_dir.mkdir()
-        return snapshot_dir
+    def temp_snapshot_dir(self, request: pytest.FixtureRequest, snapshot_base_dir: Path) -> Path:
+        """Return a per-test snapshot directory; SnapshotHelper creates it on first write."""
+        return snapshot_base_dir / request.node.name
 
     @pytest.fixture
     def snapshot_helper(
@@ -27,31 +52,40 @@ class TestSnapshotHelper:
         """Create a SnapshotHelper instance for testing."""
         return SnapshotHelper(request, temp_snapshot_dir)
 
-    def test_get_snapshot_path(self, snapshot_helper: SnapshotHelper) -> None:
+    def test_get_snapshot_path(self, serialize_helper: SnapshotHelper) -> None:
         """Test snapshot path generation."""
-        path = snapshot_helper._get_snapshot_path("test_snapshot")
+        path = serialize_helper._get_snapshot_path("test_snapshot")
         assert path.name.endswith("__test_snapshot.json")
 
-    def test_serialize_dict(self, snapshot_helper: SnapshotHelper) -> None:
+    def test_serialize_dict(self, serialize_helper: SnapshotHelper) -> None:
         """Test serialization of dictionary."""
         data = {"key": "value", "number": 42}
-        serialized = snapshot_helper._serialize(data)
+        serialized = serialize_helper._serialize(data)
 
         # Should be valid JSON
         parsed = json.loads(serialized)
         assert parsed == data
 
-    def test_serialize_with_model_dump(self, snapshot_helper: SnapshotHelper, mocker) -> None:
+    def test_serialize_with_model_dump(self, serialize_helper: SnapshotHelper, mocker) -> None:
         """Test serialization of Pydantic models."""
         # Mock a Pydantic model
         mock_model = mocker.Mock()
         mock_model.model_dump.return_value = {"id": 1, "name": "test"}
 
-        serialized = snapshot_helper._serialize(mock_model)
+        serialized = serialize_helper._serialize(mock_model)
         parsed = json.loads(serialized)
 
         assert parsed == {"id": 1, "name": "test"}
 
+    def test_serialize_real_model(self, serialize_helper: SnapshotHelper) -> None:
+        """Test that pydantic models are dumped through the cached type dispatch."""
+        from mcp.types import TextContent
+
+        content = TextContent(type="text", text="hello")
+        for _ in range(2):
+            parsed = json.loads(serialize_helper._serialize(content))
+            assert parsed["text"] == "hello"
+
     def test_assert_match_creates_snapshot(
         self, snapshot_helper: SnapshotHelper, temp_snapshot_dir: Path
     ) -> None:
@@ -60,9 +94,11 @@ class TestSnapshotHelper:
         snapshot_helper.assert_match(data, "first_run")
 
         # Check snapshot was created
-        snapshots = list(temp_snapshot_dir.glob("*.json"))
+        snapshots = _snapshot_files(temp_snapshot_dir)
         assert len(snapshots) == 1
-        assert "first_run" in snapshots[0].name
+        assert "first_run" in snapshots[0]
+        # No temporary files are left behind
+        assert os.listdir(temp_snapshot_dir) == snapshots
 
     def test_assert_match_compares_on_second_run(
         self, snapshot_helper: SnapshotHelper, temp_snapshot_dir: Path
@@ -87,9 +123,14 @@ class TestSnapshotHelper:
         snapshot_helper.assert_match(original_data, "mismatch_test")
 
         # Try with different data
-        with pytest.raises(AssertionError, match="Snapshot mismatch"):
+        with pytest.raises(AssertionError, match="Snapshot mismatch") as exc_info:
             snapshot_helper.assert_match(changed_data, "mismatch_test")
 
+        # The message shows a diff of the changed lines
+        message = str(exc_info.value)
+        assert '-  "test": "data"' in message
+        assert '+  "test": "changed"' in message
+
     def test_assert_match_text(
         self, snapshot_helper: SnapshotHelper, temp_snapshot_dir: Path
     ) -> None:
@@ -100,15 +141,13 @@ class TestSnapshotHelper:
         snapshot_helper.assert_match_text(text, "text_snapshot")
 
         # Verify file was created with .txt extension
-        txt_files = list(temp_snapshot_dir.glob("*.txt"))
+        txt_files = _snapshot_files(temp_snapshot_dir, ".txt")
         assert len(txt_files) == 1
 
         # Second run should pass
         snapshot_helper.assert_match_text(text, "text_snapshot")
 
-    def test_get_snapshot(
-        self, snapshot_helper: SnapshotHelper, temp_snapshot_dir: Path
-    ) -> None:
+    def test_get_snapshot(self, snapshot_helper: SnapshotHelper, temp_snapshot_dir: Path) -> None:
         """Test getting saved snapshot."""
         data = {"test": "data"}
 
@@ -119,9 +158,19 @@ class TestSnapshotHelper:
         retrieved = snapshot_helper.get_snapshot("get_test")
         assert retrieved == data
 
-    def test_get_snapshot_returns_none_if_not_exists(
+    def test_get_snapshot_keeps_values_orjson_cannot_parse(
         self, snapshot_helper: SnapshotHelper
     ) -> None:
+        """Test that wide integers and NaN survive a save and load."""
+        data = {"wide": 123456789012345678901234567890, "nan": float("nan")}
+
+        snapshot_helper.assert_match(data, "wide_test")
+        retrieved = snapshot_helper.get_snapshot("wide_test")
+
+        assert retrieved["wide"] == 123456789012345678901234567890
+        assert math.isnan(retrieved["nan"])
+
+    def test_get_snapshot_returns_none_if_not_exists(self, snapshot_helper: SnapshotHelper) -> None:
         """Test that get_snapshot returns None for non-existent snapshots."""
         result = snapshot_helper.get_snapshot("nonexistent")
         assert result is None
@@ -134,15 +183,13 @@ class TestSnapshotHelper:
 
         # Create snapshot
         snapshot_helper.assert_match(data, "delete_test")
-        assert len(list(temp_snapshot_dir.glob("*.json"))) == 1
+        assert len(_snapshot_files(temp_snapshot_dir)) == 1
 
         # Delete snapshot
         snapshot_helper.delete_snapshot("delete_test")
-        assert len(list(temp_snapshot_dir.glob("*.json"))) == 0
+        assert _snapshot_files(temp_snapshot_dir) == []
 
-    def test_list_snapshots(
-        self, snapshot_helper: SnapshotHelper, temp_snapshot_dir: Path
-    ) -> None:
+    def test_list_snapshots(self, snapshot_helper: SnapshotHelper, temp_snapshot_dir: Path) -> None:
         """Test listing snapshots."""
         # Create multiple snapshots
         snapshot_helper.assert_match({"test": 1}, "snapshot1")
@@ -152,3 +199,185 @@ class TestSnapshotHelper:
         snapshots = snapshot_helper.list_snapshots()
         assert "snapshot1" in snapshots
         assert "snapshot2" in snapshots
+
+    def test_assert_match_accepts_snapshot_bytes(
+        self, snapshot_helper: SnapshotHelper, temp_snapshot_dir: Path
+    ) -> None:
+        """Test that pre-serialized bytes match the equivalent value."""
+        snapshot_helper.assert_match({"test": "data"}, "bytes")
+        snapshot_helper.assert_match(snapshot_bytes({"test": "data"}), "bytes")
+
+    def test_assert_match_sees_external_snapshot_changes(
+        self, snapshot_helper: SnapshotHelper
+    ) -> None:
+        """Test that cached snapshots are reloaded after the file changes."""
+        snapshot_helper.assert_match({"test": 1}, "cached")
+        snapshot_helper.assert_match({"test": 1}, "cached")
+
+        path = snapshot_helper._get_snapshot_path("cached")
+        path.write_text(json.dumps({"test": 22}))
+
+        with pytest.raises(AssertionError, match="Snapshot mismatch"):
+            snapshot_helper.assert_match({"test": 1}, "cached")
+        snapshot_helper.assert_match({"test": 22}, "cached")
+
+    def test_assert_match_non_json_types(self, snapshot_helper: SnapshotHelper) -> None:
+        """Test that values only equal after JSON encoding still match."""
+        from mcp.types import Resource
+
+        resource = Resource(uri="users://all", name="Users")
+        snapshot_helper.assert_match(resource, "resource")
+        snapshot_helper.assert_match(resource, "resource")
+        snapshot_helper.assert_match({"items": (1, 2)}, "tuple")
+        snapshot_helper.assert_match({"items": (1, 2)}, "tuple")
+
+    def test_updates_are_queued_until_flush(
+        self, snapshot_helper: SnapshotHelper, temp_snapshot_dir: Path
+    ) -> None:
+        """Test that update-mode writes are visible before being flushed to disk."""
+        snapshot_helper.assert_match({"test": 1}, "queued")
+
+        with pytest.raises(pytest.skip.Exception):
+            snapshot_helper.assert_match({"test": 2}, "queued", update=True)
+
+        assert snapshot_helper.get_snapshot("queued") == {"test": 2}
+        path = snapshot_helper._get_snapshot_path("queued")
+        assert json.loads(path.read_text()) == {"test": 1}
+
+        flush_snapshot_writes()
+        assert json.loads(path.read_text()) == {"test": 2}
+        snapshot_helper.assert_match({"test": 2}, "queued")
+
+    def test_flush_reports_failed_writes(
+        self, request: pytest.FixtureRequest, snapshot_helper: SnapshotHelper, tmp_path: Path
+    ) -> None:
+        """Test that one failed write doesn't drop the other queued updates."""
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+        broken = SnapshotHelper(request, blocker / "__snapshots__")
+
+        for helper in (broken, snapshot_helper):
+            with pytest.raises(pytest.skip.Exception):
+                helper.assert_match({"test": 1}, "flush", update=True)
+
+        with pytest.raises(OSError, match="not_a_dir") as exc_info:
+            flush_snapshot_writes()
+
+        assert "1 snapshot update" in str(exc_info.value)
+        assert snapshot_helper._get_snapshot_path("flush").exists()
+        assert snapshot_module._WRITE_QUEUE == {}
+
+    async def test_assert_match_async(self, snapshot_helper: SnapshotHelper) -> None:
+        """Test that the async variant writes and compares like assert_match."""
+        data = {"items": list(range(100))}
+        await snapshot_helper.assert_match_async(data, "async_snapshot")
+        snapshot_helper.assert_match(data, "async_snapshot")
+
+        with pytest.raises(AssertionError, match="Snapshot mismatch"):
+            await snapshot_helper.assert_match_async({"items": []}, "async_snapshot")
+
+    def test_directory_created_on_first_write(
+        self, snapshot_helper: SnapshotHelper, temp_snapshot_dir: Path
+    ) -> None:
+        """Test that the snapshot directory only appears once a snapshot is written."""
+        assert snapshot_helper.get_snapshot("lazy") is None
+        assert snapshot_helper.list_snapshots() == []
+        assert not temp_snapshot_dir.exists()
+
+        snapshot_helper.assert_match({"a": 1}, "lazy")
+        assert snapshot_helper.list_snapshots() == ["lazy"]
+
+
+class Color(Enum):
+    RED = 1
+
+
+class Level(IntEnum):
+    HIGH = 2
+
+
+class Mode(str, Enum):
+    FAST = "fast"
+
+
+@dataclass
+class Point:
+    x: int
+
+
+class TestEncoderParity:
+    """Test that snapshots don't depend on whether orjson is installed."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            {"b": [1, 2.5, None, True], "a": {"nested": "text"}},
+            {"enum": Color.RED, "int_enum": Level.HIGH, "str_enum": Mode.FAST},
+            [Color.RED, (1, 2), {"deep": [Color.RED]}],
+            {"inf": float("inf"), "ok": 1.0},
+            {1: "int key", 2: datetime.datetime(2024, 1, 2, 3, 4, 5)},
+            {"id": uuid.UUID(int=1), "point": Point(1), "data": b"raw", "tags": {"x"}},
+            {"unicode": "caf\u00e9", "separator": "a\u2028b", "del": "\x7f"},
+            {"control": '\x00\x1f"\\/\b\f\n\r\t'},
+            {"big": 1e16, "small": 1e-07, "mid": 1.5e-05, "plain": 123.25},
+            {2: "two", 10: "ten"},
+            {"str_enum_key": {Mode.FAST: 1}},
+            {"wide": 123456789012345678901234567890},
+        ],
+    )
+    def test_orjson_matches_stdlib(self, value: object, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that both encoders write byte-identical snapshots."""
+        pytest.importorskip("orjson")
+        fast = snapshot_module._encode(value)
+
+        monkeypatch.setattr(snapshot_module, "orjson", None)
+        stdlib = snapshot_module._encode(value)
+
+        assert fast == stdlib
+
+
+class TestSnapshotBytes:
+    """Test suite for snapshot_bytes."""
+
+    def test_matches_serialize(self) -> None:
+        """Test that snapshot_bytes produces the same JSON as assert_match."""
+        from mcp.types import TextContent
+
+        content = TextContent(type="text", text="hello")
+        expected = json.dumps(content.model_dump(), indent=2, sort_keys=True, default=str)
+        assert snapshot_bytes(content) == expected.encode()
+
+    def test_memoized_per_object(self) -> None:
+        """Test that repeated calls for the same object reuse the result."""
+        from mcp.types import TextContent
+
+        content = TextContent(type="text", text="hello")
+        assert snapshot_bytes(content) is snapshot_bytes(content)
+
+
+class TestMsgpackSnapshots:
+    """Test suite for msgpack snapshot files."""
+
+    @pytest.fixture
+    def msgpack_helper(self, request: pytest.FixtureRequest, tmp_path: Path) -> SnapshotHelper:
+        """Create a SnapshotHelper storing msgpack snapshots."""
+        pytest.importorskip("msgspec")
+        return SnapshotHelper(request, tmp_path, snapshot_format="msgpack")
+
+    def test_round_trip(self, msgpack_helper: SnapshotHelper, tmp_path: Path) -> None:
+        """Test that msgpack snapshots are written, listed and compared."""
+        data = {"b": [1, 2], "a": {"nested": True}}
+        msgpack_helper.assert_match(data, "packed")
+        msgpack_helper.assert_match(data, "packed")
+
+        assert _snapshot_files(tmp_path, ".msgpack") != []
+        assert msgpack_helper.list_snapshots() == ["packed"]
+        assert msgpack_helper.get_snapshot("packed") == data
+
+        with pytest.raises(AssertionError, match="Snapshot mismatch"):
+            msgpack_helper.assert_match({"b": [1]}, "packed")
+
+    def test_unknown_format(self, request: pytest.FixtureRequest, tmp_path: Path) -> None:
+        """Test that unsupported formats are rejected."""
+        with pytest.raises(ValueError, match="Unknown snapshot format"):
+            SnapshotHelper(request, tmp_path, snapshot_format="yaml")
@@ -0,0 +1,217 @@
+"""Tests for shared utility functions."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from mcp.types import Tool
+
+from pytest_mcp import utils
+from pytest_mcp.utils import (
+    TimeoutContext,
+    deep_merge,
+    extract_error_message,
+    format_tool_signature,
+    index_tools,
+    retry_on_failure,
+    validate_tool_arguments,
+)
+
+
+class TestDeepMerge:
+    """Test suite for deep_merge."""
+
+    def test_merges_nested_dicts(self) -> None:
+        """Test that nested dicts are merged and overrides win."""
+        base = {"a": 1, "nested": {"x": 1, "deeper": {"y": 2}}, "keep": {"k": 1}}
+        override = {"b": 2, "nested": {"x": 10, "deeper": {"z": 3}}}
+
+        assert deep_merge(base, override) == {
+            "a": 1,
+            "b": 2,
+            "nested": {"x": 10, "deeper": {"y": 2, "z": 3}},
+            "keep": {"k": 1},
+        }
+
+    def test_does_not_mutate_inputs(self) -> None:
+        """Test that merged levels are copies of the base dicts."""
+        base = {"nested": {"x": 1}}
+        override = {"nested": {"y": 2}}
+
+        deep_merge(base, override)
+        assert base == {"nested": {"x": 1}}
+        assert override == {"nested": {"y": 2}}
+
+    def test_non_dict_override_replaces(self) -> None:
+        """Test that a non-dict value replaces a nested dict."""
+        assert deep_merge({"a": {"x": 1}}, {"a": None}) == {"a": None}
+
+
+class TestValidateToolArguments:
+    """Test suite for validate_tool_arguments."""
+
+    SCHEMA = {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "count": {"type": "integer"},
+            "ratio": {"type": "number"},
+            "flag": {"type": "boolean"},
+        },
+        "required": ["name"],
+    }
+
+    def test_valid_arguments(self) -> None:
+        """Test that matching arguments produce no errors."""
+        args = {"name": "x", "count": 1, "ratio": 2, "flag": True}
+        assert validate_tool_arguments(args, self.SCHEMA) == []
+
+    def test_integer_accepted_as_number(self) -> None:
+        """Test that an int satisfies a number property."""
+        assert validate_tool_arguments({"name": "x", "ratio": 3}, self.SCHEMA) == []
+
+    def test_missing_and_wrong_types(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the built-in checks used when jsonschema is not installed."""
+        monkeypatch.setattr(utils, "Draft202012Validator", None)
+        errors = validate_tool_arguments({"count": True, "ratio": "1"}, self.SCHEMA)
+        assert errors == [
+            "Missing required argument: name",
+            "Argument 'count' has wrong type: expected integer, got bool",
+            "Argument 'ratio' has wrong type: expected number, got str",
+        ]
+
+    def test_jsonschema_nested_errors(self) -> None:
+        """Test that jsonschema reports errors beyond top-level types."""
+        pytest.importorskip("jsonschema")
+        schema = {
+            "type": "object",
+            "properties": {
+                "options": {
+                    "type": "object",
+                    "properties": {"mode": {"enum": ["fast", "slow"]}},
+                }
+            },
+        }
+
+        errors = validate_tool_arguments({"options": {"mode": "medium"}}, schema)
+        assert len(errors) == 1
+        assert "medium" in errors[0]
+
+    def test_messages_match_builtin_checks(self) -> None:
+        """Test that required and type errors keep their format with jsonschema."""
+        pytest.importorskip("jsonschema")
+        errors = validate_tool_arguments({"count": True, "ratio": "1"}, self.SCHEMA)
+        assert errors == [
+            "Missing required argument: name",
+            "Argument 'count' has wrong type: expected integer, got bool",
+            "Argument 'ratio' has wrong type: expected number, got str",
+        ]
+
+    def test_unknown_type_falls_back(self) -> None:
+        """Test that schemas jsonschema rejects still get the built-in checks."""
+        schema = {
+            "type": "object",
+            "properties": {"odd": {"type": "foo"}, "name": {"type": "string"}},
+            "required": ["name"],
+        }
+
+        assert validate_tool_arguments({"odd": 1}, schema) == ["Missing required argument: name"]
+
+    def test_validator_reused_per_schema(self) -> None:
+        """Test that the compiled validator is cached for the same schema."""
+        pytest.importorskip("jsonschema")
+        validate_tool_arguments({"name": "x"}, self.SCHEMA)
+        validator = utils._VALIDATOR_CACHE[id(self.SCHEMA)][1]
+
+        validate_tool_arguments({"name": "y"}, self.SCHEMA)
+        assert utils._VALIDATOR_CACHE[id(self.SCHEMA)][1] is validator
+
+
+class TestExtractErrorMessage:
+    """Test suite for extract_error_message."""
+
+    def test_strips_prefixes(self) -> None:
+        """Test that common prefixes are removed in order."""
+        assert extract_error_message(Exception("Error: boom ")) == "boom"
+        assert extract_error_message(Exception("Error: RuntimeError: boom")) == "boom"
+
+    def test_keeps_other_messages(self) -> None:
+        """Test that messages without a known prefix are only stripped."""
+        assert extract_error_message(ValueError(" bad value: 1 ")) == "bad value: 1"
+
+
+class TestFormatToolSignature:
+    """Test suite for format_tool_signature."""
+
+    def test_formats_arguments(self) -> None:
+        """Test that arguments are rendered as keyword reprs."""
+        assert format_tool_signature("add", {"a": 1, "b": "x"}) == "add(a=1, b='x')"
+        assert format_tool_signature("ping", None) == "ping()"
+
+    def test_truncates_long_values(self) -> None:
+        """Test that large argument values are shortened."""
+        signature = format_tool_signature("echo", {"text": "a" * 500})
+        assert signature.endswith("...)")
+        assert len(signature) < 100
+
+
+class TestIndexTools:
+    """Test suite for index_tools."""
+
+    def test_keeps_first_duplicate(self) -> None:
+        """Test that the first tool wins when names repeat."""
+        first = Tool(name="echo", description="first", inputSchema={"type": "object"})
+        second = Tool(name="echo", description="second", inputSchema={"type": "object"})
+        other = Tool(name="add", inputSchema={"type": "object"})
+
+        index = index_tools([first, second, other])
+
+        assert list(index) == ["echo", "add"]
+        assert index["echo"] is first
+
+
+class TestTimeoutContext:
+    """Test suite for TimeoutContext."""
+
+    async def test_raises_on_timeout(self) -> None:
+        """Test that a slow block is cancelled with the custom message."""
+        with pytest.raises(TimeoutError, match="too slow"):
+            async with TimeoutContext(0.01, "too slow"):
+                await asyncio.sleep(1)
+
+    async def test_fast_block_completes(self) -> None:
+        """Test that a block finishing in time is left alone."""
+        async with TimeoutContext(1.0):
+            await asyncio.sleep(0)
+
+
+class TestRetryOnFailure:
+    """Test suite for retry_on_failure."""
+
+    async def test_retries_until_success(self) -> None:
+        """Test that a flaky function is retried."""
+        calls = []
+
+        @retry_on_failure(max_attempts=3, delay=0)
+        async def flaky() -> str:
+            calls.append(1)
+            if len(calls) < 3:
+                raise RuntimeError("not yet")
+            return "ok"
+
+        assert await flaky() == "ok"
+        assert len(calls) == 3
+
+    async def test_raises_last_failure(self) -> None:
+        """Test that the final attempt's exception propagates."""
+        calls = []
+
+        @retry_on_failure(max_attempts=2, delay=0)
+        async def failing() -> None:
+            calls.append(1)
+            raise ValueError(f"attempt {len(calls)}")
+
+        with pytest.raises(ValueError, match="attempt 2"):
+            await failing()
+        assert len(calls) == 2